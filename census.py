@@ -0,0 +1,77 @@
+"""
+CHECKER. (c)
+
+Author:  Gregoire Dehame
+Created: Oct 18, 2026
+Module:  checker.census
+Purpose: single pass node census, bucketing every node of the scene by type and name pattern.
+Execute: from checker import census; census.Census().of_type('unknown')
+"""
+
+try:
+    import maya.cmds as cmds
+except: pass
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+from . import utils
+
+
+class Census(object):
+    """
+    Every node of the scene with its type, listed by a single ls call and bucketed by type.
+    Type queries match inherited types like cmds.ls(type=...), and name pattern queries
+    are resolved once by cmds.ls(pattern). Type inheritance is asked once per node type.
+    """
+    def __init__(self):
+        listing = utils.noneAsList(cmds.ls(showType=True))
+        self.nodes, self.types = listing[0::2], listing[1::2]
+        self.by_type = {}
+        for node, node_type in zip(self.nodes, self.types):
+            self.by_type.setdefault(node_type, []).append(node)
+        self._inherited = {}
+        self._concrete = None
+        self._patterns = {}
+
+    def inherited(self, node_type=None) -> set:
+        if node_type not in self._inherited:
+            try: self._inherited[node_type] = set(utils.noneAsList(cmds.nodeType(node_type, inherited=True, isTypeName=True))) | {node_type}
+            except: self._inherited[node_type] = {node_type}
+        return self._inherited[node_type]
+
+    def concrete(self) -> set:
+        """
+        Return every creatable node type, listed once by cmds.allNodeTypes.
+        """
+        if self._concrete is None:
+            self._concrete = set(utils.noneAsList(cmds.allNodeTypes()))
+        return self._concrete
+
+    def of_type(self, types=None, concrete=False) -> list:
+        """
+        Return the nodes whose type is, or derives from, one of the given types.
+        concrete drops the given types that are not creatable first, so abstract types like
+        'dagNode' do not match every node deriving from them.
+        """
+        types = {types} if isinstance(types, str) else set(types)
+        if concrete: types &= self.concrete()
+        return [node for node_type, nodes in self.by_type.items() if self.inherited(node_type) & types for node in nodes]
+
+    def of_type_prefix(self, prefix=None) -> list:
+        """
+        Return the nodes of every creatable node type starting with prefix, derived types included.
+        """
+        return [node for node_type, nodes in self.by_type.items()
+                if any(name.startswith(prefix) and name in self.concrete() for name in self.inherited(node_type)) for node in nodes]
+
+    def matching(self, pattern=None) -> list:
+        """
+        Return the census nodes matching pattern, resolved once by cmds.ls so namespaces, dag
+        paths and case follow its rules.
+        """
+        if pattern not in self._patterns:
+            matches = set(utils.noneAsList(cmds.ls(pattern)))
+            self._patterns[pattern] = [node for node in self.nodes if node in matches]
+        return list(self._patterns[pattern])
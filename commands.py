@@ -13,15 +13,19 @@ try:
     import maya.api.OpenMaya as om2
     import maya.mel as mel
 except: pass    
+try:
+    import numpy as np
+except: pass
     
 import sys
 import os
 import json
+import time
 import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-from . import utils, progress
+from . import utils, progress, runtime, meshdata, overlap, transforms, shading, unused, components
 
 class Tagger(object):
     def __init__(self):
@@ -40,15 +44,17 @@ class Tagger(object):
 tag = Tagger()   
  
 class Scene():
-    def __init__(self, method='scene'):
+    def __init__(self, method='scene', context=None, undo=None):
         self.method = method
+        self.context = context if context is not None else runtime.RunContext()
+        self.undo = undo if undo is not None else not cmds.about(batch=True)
         
         
     # -------------     
     @tag('checked')
     def references_get(self, verbose=None, method='scene') -> list:
         references = []
-        nodes = utils.noneAsList(cmds.ls(type='reference'))
+        nodes = self.context.census().of_type('reference')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -59,15 +65,17 @@ class Scene():
     def references_fix(self, verbose=None, method='scene') -> list:
         nodes = self.references_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix References: {node}"): return None
-                    try: cmds.lockNode(node, lock=False)
-                    except: pass
-                    try: cmds.file(referenceNode=node, removeReference=True)
-                    except: 
-                        try: cmds.delete(node)
-                        except: logger.info('- unable to remove "%s".'%node)
+            with utils.undo_chunk("checker_references", undo=self.undo):
+                with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
+                    for i, node in enumerate(nodes):
+                        if not prog.update(f"Fix References: {node}"): return None
+                        try: cmds.lockNode(node, lock=False)
+                        except: pass
+                        try: cmds.file(referenceNode=node, removeReference=True)
+                        except: 
+                            try: cmds.delete(node)
+                            except: logger.info('- unable to remove "%s".'%node)
+        self.context.invalidate()
         return self.references_get(verbose=None, method=method)  
         
         
@@ -86,13 +94,15 @@ class Scene():
     def namespaces_fix(self, verbose=None, method='scene') -> list:
         nodes = self.namespaces_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Namespaces: {node}"): return None
-                    try: cmds.lockNode(node, lock=False)
-                    except: pass
-                    try: cmds.namespace(removeNamespace=node, mergeNamespaceWithRoot=True)
-                    except: logger.info(f'- skipping. unable to remove "{node}".')
+            with utils.undo_chunk("checker_namespaces", undo=self.undo):
+                with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
+                    for i, node in enumerate(nodes):
+                        if not prog.update(f"Fix Namespaces: {node}"): return None
+                        try: cmds.lockNode(node, lock=False)
+                        except: pass
+                        try: cmds.namespace(removeNamespace=node, mergeNamespaceWithRoot=True)
+                        except: logger.info(f'- skipping. unable to remove "{node}".')
+        self.context.invalidate()
         return self.namespaces_get(verbose=None, method=method)
       
         
@@ -100,7 +110,7 @@ class Scene():
     @tag('checked')    
     def unknown_nodes_get(self, verbose=None, method='scene') -> list:
         unknown_nodes = []
-        nodes = utils.noneAsList(cmds.ls(type='unknown'))
+        nodes = self.context.census().of_type('unknown')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -111,13 +121,8 @@ class Scene():
     def unknown_nodes_fix(self, verbose=None, method='scene') -> list:
         nodes = self.unknown_nodes_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Unknown Nodes: {node}"): return None
-                    try:
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except: logger.info('- unable to remove "%s".'%node)  
+            with utils.undo_chunk("checker_unknown_nodes", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.unknown_nodes_get(verbose=None, method=method)
      
         
@@ -136,11 +141,13 @@ class Scene():
     def unknown_plugins_fix(self, verbose=None, method='scene') -> list:
         nodes = self.unknown_plugins_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Unknown Plugins: {node}"): return None
-                    try: cmds.unknownPlugin(node, remove=True)
-                    except: logger.info('- unable to remove "%s".'%node)
+            with utils.undo_chunk("checker_unknown_plugins", undo=self.undo):
+                with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
+                    for i, node in enumerate(nodes):
+                        if not prog.update(f"Fix Unknown Plugins: {node}"): return None
+                        try: cmds.unknownPlugin(node, remove=True)
+                        except: logger.info('- unable to remove "%s".'%node)
+        self.context.invalidate()
         return self.unknown_plugins_get(verbose=None, method=method)
     
         
@@ -148,7 +155,7 @@ class Scene():
     @tag('checked')    
     def unused_shaders_get(self, verbose=None, method='scene') -> list:
         unused_shaders = []
-        nodes = utils.noneAsList(cmds.ls(type='shadingEngine'))
+        nodes = self.context.census().of_type('shadingEngine')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -162,41 +169,31 @@ class Scene():
     def unused_shaders_fix(self, verbose=None, method='scene') -> list:
         nodes = self.unused_shaders_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Unused Shaders: {node}"): return None
-                    for shader in utils.noneAsList(cmds.listConnections('%s.surfaceShader'%node)):
-                        try:
-                            cmds.lockNode(shader, lock=False)
-                            cmds.delete(shader)
-                        except: logger.info('- unable to remove "%s".'%shader)  
-                    try:
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except: logger.info('- unable to remove "%s".'%node) 
+            graph = self.context.graph()
+            shaders = [shader for node in nodes for shader in graph.sources_of(node, 'surfaceShader')]
+            with utils.undo_chunk("checker_unused_shaders", undo=self.undo): utils.delete_nodes(shaders + nodes)
+        self.context.invalidate()
         return self.unused_shaders_get(verbose=None,  method=method)
     
     
     # -------------     
     @tag('checked')    
     def unused_nodes_get(self, verbose=None, method='scene') -> list:
-        unused_nodes = []
-        return unused_nodes
+        return unused.unused_nodes(self.context.graph())
         
     def unused_nodes_fix(self, verbose=None, method='scene') -> list:
         nodes = self.unused_nodes_get(verbose=None,  method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Unused Nodes: {node}"): return None
-        return self.unused_shaders_get(verbose=None,  method=method)    
+            with utils.undo_chunk("checker_unused_nodes", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
+        return self.unused_nodes_get(verbose=None,  method=method)    
         
         
     # -------------     
     @tag('checked')    
     def animation_layers_get(self, verbose=None, method='scene') -> list:
         animation_layers = []
-        nodes = utils.noneAsList(cmds.ls(type='animLayer'))
+        nodes = self.context.census().of_type('animLayer')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -207,13 +204,8 @@ class Scene():
     def animation_layers_fix(self, verbose=None, method='scene') -> list:
         nodes = self.animation_layers_get(verbose=None,  method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Animation Layers: {node}"): return None
-                    try:
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except: logger.info('- unable to remove "%s".'%node)
+            with utils.undo_chunk("checker_animation_layers", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.animation_layers_get(verbose=None,  method=method)
       
         
@@ -221,7 +213,7 @@ class Scene():
     @tag('checked')   
     def display_layers_get(self, verbose=None, method='scene') -> list:
         display_layers = []
-        nodes = utils.noneAsList(cmds.ls(type='displayLayer'))
+        nodes = self.context.census().of_type('displayLayer')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -232,13 +224,8 @@ class Scene():
     def display_layers_fix(self, verbose=None, method='scene') -> list:
         nodes = self.display_layers_get(verbose=None,  method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Display Layers: {node}"): return None
-                    try:
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except: logger.info('- unable to remove "%s".'%node)
+            with utils.undo_chunk("checker_display_layers", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.display_layers_get(verbose=None,  method=method)
     
         
@@ -246,7 +233,7 @@ class Scene():
     @tag('checked')    
     def render_layers_get(self, verbose=None, method='scene') -> list:
         render_layers = []
-        nodes = utils.noneAsList(cmds.ls(type='renderLayer'))
+        nodes = self.context.census().of_type('renderLayer')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -257,13 +244,8 @@ class Scene():
     def render_layers_fix(self, verbose=None, method='scene') -> list:
         nodes = self.render_layers_get(verbose=None,  method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Render Layers: {node}"): return None
-                    try:
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except: logger.info('- unable to remove "%s".'%node)
+            with utils.undo_chunk("checker_render_layers", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.render_layers_get(verbose=None,  method=method)
     
     
@@ -271,7 +253,7 @@ class Scene():
     @tag('checked')    
     def script_nodes_get(self, verbose=None, method='scene') -> list:
         script_nodes = []
-        nodes = utils.noneAsList(cmds.ls(type='script'))
+        nodes = self.context.census().of_type('script')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -282,14 +264,8 @@ class Scene():
     def script_nodes_fix(self, verbose=None, method='scene') -> list:
         nodes = self.script_nodes_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Script Nodes: {node}"): return None
-                    try: 
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except:
-                        logger.info('- unable to remove "%s".'%node) 
+            with utils.undo_chunk("checker_script_nodes", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.script_nodes_get(verbose=None, method=method)
      
         
@@ -297,7 +273,7 @@ class Scene():
     @tag('checked')    
     def expression_nodes_get(self, verbose=None, method='scene') -> list:
         expression_nodes = []
-        nodes = utils.noneAsList(cmds.ls(type='expression'))
+        nodes = self.context.census().of_type('expression')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -308,14 +284,8 @@ class Scene():
     def expression_nodes_fix(self, verbose=None, method='scene') -> list:
         nodes = self.expression_nodes_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Expression Nodes: {node}"): return None
-                    try: 
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except:
-                        logger.info('- unable to remove "%s".'%node) 
+            with utils.undo_chunk("checker_expression_nodes", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.expression_nodes_get(verbose=None, method=method)  
     
     
@@ -323,7 +293,7 @@ class Scene():
     @tag('checked')    
     def light_editor_nodes_get(self, verbose=None, method='scene') -> list:
         light_editor_nodes = []
-        nodes = utils.noneAsList(cmds.ls(type='lightEditor'))
+        nodes = self.context.census().of_type('lightEditor')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -334,14 +304,8 @@ class Scene():
     def light_editor_nodes_fix(self, verbose=None, method='scene') -> list:
         nodes = self.light_editor_nodes_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Light Editor Nodes: {node}"): return None
-                    try: 
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except:
-                        logger.info('- unable to remove "%s".'%node) 
+            with utils.undo_chunk("checker_light_editor_nodes", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.light_editor_nodes_get(verbose=None, method=method)  
     
     
@@ -349,27 +313,19 @@ class Scene():
     @tag('checked')    
     def time_editor_nodes_get(self, verbose=None, method='scene') -> list:
         time_editor_nodes = []
-        nodes = [node_type for node_type in cmds.allNodeTypes() if node_type.startswith("timeEditor")]
+        nodes = self.context.census().of_type_prefix('timeEditor')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Time Editor Nodes: {node}"): return None
-                    for node in utils.noneAsList(cmds.ls(type=node)):
-                        if node not in time_editor_nodes:
-                            time_editor_nodes.append(node)
+                    if node not in time_editor_nodes: time_editor_nodes.append(node)
         return time_editor_nodes
         
     def time_editor_nodes_fix(self, verbose=None, method='scene') -> list:
         nodes = self.time_editor_nodes_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Time Editor Nodes: {node}"): return None
-                    try: 
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except:
-                        logger.info('- unable to remove "%s".'%node) 
+            with utils.undo_chunk("checker_time_editor_nodes", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.time_editor_nodes_get(verbose=None, method=method)  
     
     
@@ -377,27 +333,19 @@ class Scene():
     @tag('checked')    
     def cache_nodes_get(self, verbose=None, method='scene') -> list:
         cache_nodes = []
-        nodes = [node_type for node_type in cmds.allNodeTypes() if node_type in ['cacheBlend','cacheFile']]
+        nodes = self.context.census().of_type(['cacheBlend','cacheFile'], concrete=True)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Cache Nodes: {node}"): return None
-                    for node in utils.noneAsList(cmds.ls(type=node)):
-                        if node not in cache_nodes:
-                            cache_nodes.append(node)
+                    if node not in cache_nodes: cache_nodes.append(node)
         return cache_nodes
         
     def cache_nodes_fix(self, verbose=None, method='scene') -> list:
         nodes = self.cache_nodes_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Cache Nodes: {node}"): return None
-                    try: 
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except:
-                        logger.info('- unable to remove "%s".'%node) 
+            with utils.undo_chunk("checker_cache_nodes", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.cache_nodes_get(verbose=None, method=method)     
     
     
@@ -405,27 +353,19 @@ class Scene():
     @tag('checked')    
     def dag_nodes_get(self, verbose=None, method='scene') -> list:
         dag_nodes = []
-        nodes = [node_type for node_type in cmds.allNodeTypes() if node_type in ['dagContainer','dagNode']]
+        nodes = self.context.census().of_type(['dagContainer','dagNode'], concrete=True)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Dag Nodes: {node}"): return None
-                    for node in utils.noneAsList(cmds.ls(type=node)):
-                        if node not in dag_nodes:
-                            dag_nodes.append(node)
+                    if node not in dag_nodes: dag_nodes.append(node)
         return dag_nodes
         
     def dag_nodes_fix(self, verbose=None, method='scene') -> list:
         nodes = self.dag_nodes_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Dag Nodes: {node}"): return None
-                    try: 
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except:
-                        logger.info('- unable to remove "%s".'%node) 
+            with utils.undo_chunk("checker_dag_nodes", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.dag_nodes_get(verbose=None, method=method)  
     
     
@@ -433,7 +373,7 @@ class Scene():
     @tag('checked')    
     def hypershade_nodes_get(self, verbose=None, method='scene') -> list:
         hypershade_nodes = []
-        nodes = cmds.ls('*hyperShade*')
+        nodes = self.context.census().matching('*hyperShade*')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -444,14 +384,8 @@ class Scene():
     def hypershade_nodes_fix(self, verbose=None, method='scene') -> list:
         nodes = self.hypershade_nodes_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Hypershade Nodes: {node}"): return None
-                    try: 
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except:
-                        logger.info('- unable to remove "%s".'%node) 
+            with utils.undo_chunk("checker_hypershade_nodes", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.hypershade_nodes_get(verbose=None, method=method)            
     
     
@@ -459,26 +393,19 @@ class Scene():
     @tag('checked')    
     def poly_nodes_get(self, verbose=None, method='scene') -> list:
         poly_nodes = []
-        nodes = [node_type for node_type in cmds.allNodeTypes() if node_type.startswith("poly")]
+        nodes = self.context.census().of_type_prefix('poly')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Poly Nodes: {node}"): return None
-                    for poly in utils.noneAsList(cmds.ls(type=node)):
-                        if poly not in poly_nodes:
-                            poly_nodes.append(poly)
+                    if node not in poly_nodes: poly_nodes.append(node)
         return poly_nodes
         
     def poly_nodes_fix(self, verbose=None, method='scene') -> list:
         nodes = self.poly_nodes_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Poly Nodes: {node}"): return None
-                    try: cmds.lockNode(node, lock=False)
-                    except: pass
-                    try: cmds.delete(node)
-                    except:logger.info('- unable to remove "%s".'%node) 
+            with utils.undo_chunk("checker_poly_nodes", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.poly_nodes_get(verbose=None, method=method)
     
     
@@ -486,25 +413,19 @@ class Scene():
     @tag('checked')    
     def xgen_nodes_get(self, verbose=None, method='scene') -> list:
         xgen_nodes = []
-        nodes = [node_type for node_type in cmds.allNodeTypes() if node_type.startswith("xgm")]
+        nodes = self.context.census().of_type_prefix('xgm')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get XGen Nodes: {node}"): return None
-                    for poly in utils.noneAsList(cmds.ls(type=node)):
-                        if poly not in xgen_nodes: xgen_nodes.append(poly)
+                    if node not in xgen_nodes: xgen_nodes.append(node)
         return xgen_nodes
         
     def xgen_nodes_fix(self, verbose=None, method='scene') -> list:
         nodes = self.xgen_nodes_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix XGen Nodes: {node}"): return None
-                    try: cmds.lockNode(node, lock=False)
-                    except: pass
-                    try: cmds.delete(node)
-                    except:logger.info('- unable to remove "%s".'%node) 
+            with utils.undo_chunk("checker_xgen_nodes", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.xgen_nodes_get(verbose=None, method=method)    
         
         
@@ -512,7 +433,7 @@ class Scene():
     @tag('checked')    
     def turtle_nodes_get(self, verbose=None, method='scene') -> list:
         turtle_nodes = []
-        nodes = cmds.ls(type='ilrBakeLayer')
+        nodes = self.context.census().of_type('ilrBakeLayer')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -523,13 +444,8 @@ class Scene():
     def turtle_nodes_fix(self, verbose=None, method='scene') -> list:
         nodes = self.turtle_nodes_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Turtle Nodes: {node}"): return None
-                    try: cmds.lockNode(node, lock=False)
-                    except: pass
-                    try: cmds.delete(node)
-                    except:logger.info('- unable to remove "%s".'%node) 
+            with utils.undo_chunk("checker_turtle_nodes", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.turtle_nodes_get(verbose=None, method=method)        
         
         
@@ -537,7 +453,7 @@ class Scene():
     @tag('checked')    
     def cameras_get(self, verbose=None, method='scene') -> list:
         cameras_nodes = []
-        nodes = utils.noneAsList(cmds.ls(type='camera'))
+        nodes = self.context.census().of_type('camera')
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -553,41 +469,35 @@ class Scene():
     def cameras_fix(self, verbose=None, method='scene') -> list:
         nodes = self.cameras_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Cameras: {node}"): return None
-                    try: 
-                        cmds.lockNode(node, lock=False)
-                        cmds.delete(node)
-                    except:
-                        logger.info('- unable to remove "%s".'%node) 
+            with utils.undo_chunk("checker_cameras", undo=self.undo): utils.delete_nodes(nodes)
+        self.context.invalidate()
         return self.cameras_get(verbose=None, method=method)            
 
 
 
 class Objects():
-    def __init__(self):
-        pass 
+    def __init__(self, context=None, undo=None):
+        self.context = context if context is not None else runtime.RunContext()
+        self.undo = undo if undo is not None else not cmds.about(batch=True)
         
         
     # -------------         
     @tag('checked')    
     def contruction_history_get(self, verbose=None, method='scene') -> list:
         history = []
-        nodes = utils.mesh_array(method) + utils.transform_array(method)
+        nodes = self.context.mesh_array(method) + self.context.transform_array(method)
         if nodes:
+            graph = self.context.graph()
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Contruction History: {node}"): return None
-                    for shape in utils.noneAsList(cmds.listRelatives(node, shapes=True, fullPath=True)):
-                        if cmds.nodeType(shape) == 'mesh':
+                    for shape in self.context.shapes(node):
+                        if self.context.node_type(shape) == 'mesh':
                             uncorrect_hist = []
-                            for hist in utils.noneAsList(cmds.listHistory(shape)): 
-                                if cmds.nodeType(hist) not in ['mesh', 'groupId', 'GroupId', 'shadingEngine', 'objectSet', 'textureEditorIsolateSelectSet']:
+                            for hist in graph.upstream(shape, 'inMesh'): 
+                                if graph.node_type(hist) not in ['mesh', 'groupId', 'GroupId', 'shadingEngine', 'objectSet', 'textureEditorIsolateSelectSet']:
                                     if hist not in uncorrect_hist: uncorrect_hist.append(hist)
-                            if len(uncorrect_hist) > 1: 
-                                print(uncorrect_hist)
-                                if shape not in history: history.append(shape)
+                            if len(uncorrect_hist) > 1 and shape not in history: history.append(shape)
         return history
         
     def contruction_history_fix(self, verbose=None, method='scene') -> list:
@@ -597,13 +507,15 @@ class Objects():
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Fix Contruction History: {node}"): return None
                     cmds.delete(node, constructionHistory=True)
+        self.context.invalidate()
         return self.contruction_history_get(verbose=None, method=method)
     
     
     # -------------  
     @tag('checked')     
+    @tag('edits')
     def poly_display_get(self, verbose=None, method='scene') -> list:
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -622,30 +534,20 @@ class Objects():
     @tag('checked')     
     def intermediate_objects_get(self, verbose=None, method='scene') -> list:
         intermediate_objects = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Intermediate Objects: {node}"): return None
-                    for shape in utils.noneAsList(cmds.listRelatives(node, shapes=True, fullPath=True)):
+                    for shape in self.context.shapes(node):
                         if cmds.ls(shape, intermediateObjects=True) and node not in intermediate_objects: intermediate_objects.append(node)  
         return intermediate_objects
         
         
     # -------------           
-    def freeze_transformations_get(self, verbose=None, method='scene') -> list:
-        unfrozen_transforms = []
-        nodes = utils.mesh_array(method) + utils.transform_array(method)
-        if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Get Unfrozen Transformations: {node}"): return None
-                    translation = cmds.xform(node, query=True, worldSpace=True, translation=True)
-                    rotation = cmds.xform(node, query=True, worldSpace=True, rotation=True)
-                    scale = cmds.xform(node, query=True, worldSpace=True, scale=True)
-                    if translation != [0.0, 0.0, 0.0] or rotation != [0.0, 0.0, 0.0] or scale != [1.0, 1.0, 1.0]:
-                        unfrozen_transforms.append(node)
-        return unfrozen_transforms
+    def freeze_transformations_get(self, verbose=None, method='scene', tolerance=transforms.MATRIX_TOLERANCE) -> list:
+        data = self.context.transform_data(method)
+        return data.select(data.unfrozen(tolerance))
         
     def freeze_transformations_fix(self, verbose=None, method='scene') -> list:
         nodes = self.freeze_transformations_get(verbose=None, method=method)
@@ -656,22 +558,15 @@ class Objects():
                     [cmds.setAttr(f"{node}.{attr}", lock=False) for attr in ['tx','ty','tz','rx','ry','rz','sx','sy','sz']]
                     cmds.makeIdentity(f"{node}", apply=True, translate=True, rotate=True, scale=True, normal=False)  
                     cmds.delete(node, constructionHistory=True) 
+        self.context.invalidate()
         return self.freeze_transformations_get(verbose=None, method=method)
     
     
     # -------------  
     @tag('checked') 
-    def world_pivot_get(self, verbose=None, method='scene') -> list:
-        uncentered_pivot = []
-        nodes = utils.mesh_array(method) + utils.transform_array()
-        if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Get Pivot Point: {node}"): return None
-                    for attr in ['rpx','rpy','rpz','spx','spy','spz']:
-                        if cmds.getAttr(f"{node}.{attr}") != 0:
-                            if node not in uncentered_pivot: uncentered_pivot.append(node)
-        return uncentered_pivot
+    def world_pivot_get(self, verbose=None, method='scene', tolerance=transforms.PIVOT_TOLERANCE) -> list:
+        data = self.context.transform_data(method)
+        return data.select(data.uncentered_pivots(tolerance))
         
     def world_pivot_fix(self, verbose=None, method='scene') -> list:
         nodes = self.world_pivot_get(verbose=None, method=method)
@@ -681,22 +576,16 @@ class Objects():
                     if not prog.update(f"Fix Pivot Point: {node}"): return None
                     for attr in ['rpx','rpy','rpz','spx','spy','spz']:
                         cmds.setAttr(f"{node}.{attr}", 0, lock=False) 
+        self.context.invalidate()
         return self.world_pivot_get(verbose=None, method=method)  
         
           
     @tag('checked')   
     # -------------           
     def locked_transformations_get(self, verbose=None, method='scene') -> list:
-        locked_transforms = []
-        nodes = utils.mesh_array(method) + utils.transform_array(method)
-        if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Get Locked Transformations: {node}"): return None
-                    for attribute in ['translateX','translateY','translateZ','rotateX','rotateY','rotateZ','visibility']:
-                        if cmds.getAttr(f'{node}.{attribute}', lock=True)       == True  and node not in locked_transforms: locked_transforms.append(node)
-                        if cmds.getAttr(f'{node}.{attribute}', keyable=True)    == False and node not in locked_transforms: locked_transforms.append(node)
-        return locked_transforms
+        attributes = ['translateX','translateY','translateZ','rotateX','rotateY','rotateZ','visibility']
+        data = self.context.transform_data(method)
+        return data.select(data.any_locked(attributes) | data.any_not_keyable(attributes))
         
     def locked_transformations_fix(self, verbose=None, method='scene') -> list:
         nodes = self.locked_transformations_get(verbose=None, method=method)
@@ -710,67 +599,63 @@ class Objects():
                             cmds.setAttr(f'{node}.{attribute}', channelBox=True)
                             cmds.setAttr(f'{node}.{attribute}', keyable=True)
                         except: logger.info(f'- unable to edit {node}.{attribute} status.')    
+        self.context.invalidate()
         return self.locked_transformations_get(verbose=None, method=method)    
         
         
     # -------------  
     @tag('checked')   
-    def locked_normals_get(self, verbose=None, method='scene') -> list:
+    def locked_normals_get(self, verbose=None, method='scene', per_vertex=False, pass_fail=False) -> list:
         locked_normals = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Locked Normals: {node}"): return None
-                    for shape in utils.noneAsList(cmds.listRelatives(node, shapes=True, fullPath=True)):
-                        if True in cmds.polyNormalPerVertex(f'{shape}.vtx[*]', query=True, freezeNormal=True):
-                            locked_normals.append(shape)
-                            continue
+                    data = self.context.mesh_data(node)
+                    if per_vertex:
+                        locked_normals.extend(components.compact(data.name, 'vtx', data.locked_vertices()))
+                    elif data.has_locked_normals():
+                        locked_normals.append(data.name)
+                    # pass / fail only needs the first mesh holding locked normals.
+                    if pass_fail and locked_normals: break
         return locked_normals                
         
     def locked_normals_fix(self, verbose=None, method='scene') -> list:
         nodes = self.locked_normals_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Locked Normals: {node}"): return None
-                    cmds.polyNormalPerVertex(node, unFreezeNormal=True)
+            with utils.undo_chunk("checker_locked_normals", undo=self.undo):
+                cmds.polyNormalPerVertex(nodes, unFreezeNormal=True)
+        self.context.invalidate()
         return self.locked_normals_get(verbose=None, method=method)
         
         
     # -------------  
     @tag('checked')     
-    def vertex_transforms_get(self, verbose=None, method='scene') -> list:
+    def vertex_transforms_get(self, verbose=None, method='scene', tolerance=meshdata.TWEAK_TOLERANCE) -> list:
         vertex_transformed = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Vertex Transformations: {node}"): return None
-                    for shape in utils.noneAsList(cmds.listRelatives(node, shapes=True, fullPath=True)):
-                        try:
-                            for tweak in cmds.getAttr(f'{shape}.pnts[*]'):
-                                for i in tweak:
-                                    if abs(i) > 0.000000000000001 and node not in vertex_transformed:
-                                            vertex_transformed.append(node)
-                        except: pass
+                    for shape in self.context.shapes(node):
+                        if meshdata.has_tweaks(shape, tolerance) and node not in vertex_transformed:
+                            vertex_transformed.append(node)
         return vertex_transformed    
         
     def vertex_transforms_fix(self, verbose=None, method='scene') -> list:
+        skipped = []
         nodes = self.vertex_transforms_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Fix Vertex Transformations: {node}"): return None
-                    cmds.polyMoveVertex(node, constructionHistory=False)
-                    cmds.polySmooth(f"{node}.vtx[*]", divisions=0, constructionHistory=False)
-                    mfn = om2.MFnMesh(om2.MGlobal.getSelectionListByName(node).getDagPath(0))
-                    for shape in cmds.listRelatives(node, shapes=True, fullPath=True):
-                        for i in range(len(mfn.getPoints())):
-                            cmds.setAttr(f"{shape}.pnts[{str(i)}].pntx",0)
-                            cmds.setAttr(f"{shape}.pnts[{str(i)}].pnty",0)
-                            cmds.setAttr(f"{shape}.pnts[{str(i)}].pntz",0)
-                    cmds.select(clear=True)
+            with utils.undo_chunk("checker_vertex_transforms", undo=self.undo):
+                with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
+                    for i, node in enumerate(nodes):
+                        if not prog.update(f"Fix Vertex Transformations: {node}"): return None
+                        for shape in self.context.shapes(node):
+                            if self.context.node_type(shape) == 'mesh' and not meshdata.bake_tweaks(shape): skipped.append(shape)
+            if skipped: logger.warning(f"Tweaks left unbaked, construction history must be baked first: {skipped}")
+        self.context.invalidate()
         return self.vertex_transforms_get(verbose=None, method=method)
 
 
@@ -778,24 +663,28 @@ class Objects():
     @tag('checked')    
     def duplicated_names_get(self, verbose=None, method='scene') -> list:
         duplicated_names = []
-        nodes = utils.mesh_array(method) + utils.transform_array()
+        nodes = self.context.mesh_array(method) + self.context.transform_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Duplicated Names: {node}"): return None
-                    for dag in cmds.ls(nodes, dag=1):
-                        if dag.count('|') and dag not in duplicated_names: 
-                            if cmds.nodeType(dag) == 'transform': duplicated_names.append(dag)
+                    # partial names only hold a '|' when their short name clashes somewhere in the scene.
+                    if node.count('|'): duplicated_names.append(node)
         return duplicated_names                
                  
     def duplicated_names_fix(self, verbose=None, method='scene') -> list:
         nodes = self.duplicated_names_get(verbose=None, method=method)
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
+            # rename deepest paths first, so parents long names stay valid during the fix.
+            paths = sorted([self.context.dag_path(node).fullPathName() for node in nodes], key=lambda path: path.count('|'), reverse=True)
+            counters = {}
+            with progress.ProgressWindow(len(paths), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
+                for i, node in enumerate(paths):
                     if not prog.update(f"Fix Duplicated Names: {node}"): return None
                     new_name = ''.join(node.rsplit('|')[-1])
-                    cmds.rename(f"{node}", f"{new_name}__{str(i+1)}")
+                    counters[new_name] = counters.get(new_name, 0) + 1
+                    cmds.rename(f"{node}", f"{new_name}__{str(counters[new_name])}")
+        self.context.invalidate()
         return self.duplicated_names_get(verbose=None, method=method)
         
         
@@ -803,38 +692,38 @@ class Objects():
     @tag('checked')     
     def extra_shapes_get(self, verbose=None, method='scene') -> list:
         extra_shapes = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
-            array_shapes = []
+            graph = self.context.graph()
+            array_shapes = {}
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Extra Shapes: {node}"): return None
-                    for geo in utils.noneAsList(cmds.listRelatives(node, shapes=True, fullPath=True)):
-                        if cmds.nodeType(geo) in ['mesh','nurbsSurface']:
-                            if 'geometryShape' in cmds.nodeType(geo, inherited=True) and geo not in array_shapes: array_shapes.append(geo)
-                            if 'nurbsSurface'  in cmds.nodeType(geo, inherited=True) and geo not in array_shapes: array_shapes.append(geo)  
-                            if not cmds.listConnections(geo, c=True, shapes=True) and geo not in extra_shapes:
+                    for geo in self.context.shapes(node):
+                        if self.context.node_type(geo) in ['mesh','nurbsSurface']:
+                            if graph.inherits(geo, ['geometryShape', 'nurbsSurface']) and geo not in array_shapes: array_shapes[geo] = node
+                            if not graph.neighbours(geo) and geo not in extra_shapes:
                                 extra_shapes.append(geo)          
                                 
-                            shading_engines = cmds.listConnections(geo, type="shadingEngine")
+                            shading_engines = [sg for sg in graph.neighbours(geo) if graph.node_type(sg) == 'shadingEngine']
                             if not shading_engines and geo not in extra_shapes:
                                 extra_shapes.append(geo)
                                 
                             if shading_engines:
                                 does_not_have_shaders = True
                                 for sg in shading_engines:
-                                    connected_shaders = cmds.listConnections(sg + '.surfaceShader')
-                                    if connected_shaders:
+                                    if graph.sources_of(sg, 'surfaceShader'):
                                         does_not_have_shaders = False
                                         
                                 if does_not_have_shaders and geo not in extra_shapes:
                                     extra_shapes.append(geo)
                               
-            for s in array_shapes:
+            for s, node in array_shapes.items():
                 if s.count('Orig'):
                     is_deformed = False
-                    for h in cmds.listHistory(cmds.listRelatives(s, parent=True, fullPath=True)):
-                        if cmds.nodeType(h, inherited=True).count('geometryFilter'): is_deformed=True
+                    for shape in self.context.shapes(node):
+                        for h in graph.upstream(shape, 'inMesh'):
+                            if graph.inherits(h, 'geometryFilter'): is_deformed=True
                     if is_deformed is False: extra_shapes.append(s)
         return extra_shapes        
         
@@ -846,6 +735,7 @@ class Objects():
                     if not prog.update(f"Fix Extra Shapes: {node}"): return None
                     try: cmds.delete(node)
                     except:logger.info('- unable to remove "%s".'%node) 
+        self.context.invalidate()
         return self.extra_shapes_get(verbose=None, method=method)
             
         
@@ -853,40 +743,35 @@ class Objects():
     @tag('checked')     
     def shapes_names_get(self, verbose=None, method='scene') -> list:
         uncorrect_names = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
+            index = self.context.hierarchy()
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Shapes Names: {node}"): return None
-                    for shape in utils.noneAsList(cmds.listRelatives(node, shapes=True, fullPath=True)):
-                        if ''.join(shape.rsplit('|')[-1]) != str(node) + 'Shape' and node not in uncorrect_names:
+                    for shape in index.shapes(self.context.full_path(node)):
+                        if shape.rsplit('|')[-1] != node.rsplit('|')[-1] + 'Shape' and shape not in uncorrect_names:
                             uncorrect_names.append(shape)
         return uncorrect_names                
         
     def shapes_names_fix(self, verbose=None, method='scene') -> list:
         nodes = self.shapes_names_get(verbose=None, method=method)
         if nodes:
+            index = self.context.hierarchy()
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Fix Shapes Names: {node}"): return None
-                    parent = cmds.listRelatives(node, parent=True)[0]
-                    cmds.rename(node, f"{parent}Shape")
+                    parent = index.paths[index.parents[index.index[node]]]
+                    cmds.rename(node, f"{parent.rsplit('|')[-1]}Shape")
+        self.context.invalidate()
         return self.shapes_names_get(verbose=None, method=method)
         
         
     # -------------  
     @tag('checked')     
     def locked_transforms_get(self, verbose=None, method='scene') -> list:
-        locked_transforms = []
-        nodes = utils.mesh_array(method) + utils.transform_array(method)
-        if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Get Transforms: {node}"): return None
-                    for attribute in ['translateX','translateY','translateZ', 'rotateX', 'rotateY', 'rotateZ', 'scaleX', 'scaleY', 'scaleZ', 'visibility']:
-                        if cmds.getAttr(f"{node}.{attribute}", lock=True) == True and node not in locked_transforms:
-                            locked_transforms.append(node)
-        return locked_transforms
+        data = self.context.transform_data(method)
+        return data.select(data.any_locked(transforms.ATTRIBUTES))
         
     def locked_transforms_fix(self, verbose=None, method='scene') -> list:
         nodes = self.locked_transforms_get(verbose=None, method=method)
@@ -896,6 +781,7 @@ class Objects():
                     if not prog.update(f"Fix Transforms: {node}"): return None
                     for attribute in ['translateX','translateY','translateZ', 'rotateX', 'rotateY', 'rotateZ', 'scaleX', 'scaleY', 'scaleZ', 'visibility']:
                         cmds.setAttr(f"{node}.{attribute}", lock=False, keyable=True)
+        self.context.invalidate()
         return  self.locked_transforms_get(verbose=None, method=method)       
         
         
@@ -903,12 +789,13 @@ class Objects():
     @tag('checked')     
     def empty_groups_get(self, verbose=None, method='scene') -> list:
         empty_groups = []
-        nodes = utils.transform_array(method)
+        nodes = self.context.transform_array(method)
         if nodes:
+            index = self.context.hierarchy()
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Empty Groups: {node}"): return None
-                    if not cmds.listRelatives(node, allDescendents=True) and node not in empty_groups:
+                    if not index.descendant_count(self.context.full_path(node)) and node not in empty_groups:
                         empty_groups.append(node)
         return empty_groups            
         
@@ -923,6 +810,7 @@ class Objects():
                         cmds.delete(node)
                     except:
                         logger.info('- unable to remove "%s".'%node)
+        self.context.invalidate()
         return self.empty_groups_get(verbose=None, method=method)
         
         
@@ -930,16 +818,14 @@ class Objects():
     @tag('checked')     
     def constraints_get(self, verbose=None, method='scene') -> list:
         constraints = []
-        nodes = utils.mesh_array(method) + utils.transform_array(method)
+        nodes = self.context.mesh_array(method) + self.context.transform_array(method)
         if nodes:
-            constraints_nodes = ['parentConstraint', 'pointConstraint', 'orientConstraint', 'scaleConstraint', 'aimConstraint', 'poleVectorConstraint']
+            graph = self.context.graph()
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Constraints: {node}"): return None
-                    try:
-                        for constraint in utils.noneAsList(cmds.listConnections(node, type="constraint")):
-                            if constraint not in constraints: constraints.append(constraint)      
-                    except: pass
+                    for constraint in graph.neighbours(self.context.full_path(node)):
+                        if graph.inherits(constraint, 'constraint') and constraint not in constraints: constraints.append(constraint)
         return constraints
         
     def constraints_fix(self, verbose=None, method='scene') -> list:
@@ -953,6 +839,7 @@ class Objects():
                         cmds.delete(node)
                     except:
                         logger.info('- unable to remove "%s".'%node)
+        self.context.invalidate()
         return self.constraints_get(verbose=None, method=method)  
         
         
@@ -960,17 +847,16 @@ class Objects():
     @tag('checked')     
     def deformers_get(self, verbose=None, method='scene') -> list:
         deformers = []
-        nodes = utils.mesh_array(method) + utils.transform_array(method)
+        nodes = self.context.mesh_array(method) + self.context.transform_array(method)
         if nodes:
+            graph = self.context.graph()
             deformer_list = ['blendShape', 'cluster', 'deltaMush', 'ffd', 'jiggle', 'nonLinear', 'proximityWrap', 'sculpt', 'shrinkWrap', 'skinCluster', 'softMod', 'tension', 'textureDeformer', 'wire', 'wrap']
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Deformers: {node}"): return None
-                    history = cmds.listHistory(node, gl=True)
-                    try: 
-                        for deformer in utils.noneAsList(cmds.ls(history, type=deformer_list)):
-                            if deformer not in deformers: deformers.append(deformer)
-                    except: pass
+                    for shape in self.context.shapes(node):
+                        for deformer in graph.upstream(shape, 'inMesh'):
+                            if graph.inherits(deformer, deformer_list) and deformer not in deformers: deformers.append(deformer)
         return deformers
         
     def deformers_fix(self, verbose=None, method='scene') -> list:
@@ -985,6 +871,7 @@ class Objects():
                     except:
                         logger.info('- unable to remove "%s".'%node)
             self.extra_shapes_fix(verbose=None, method=method)            
+        self.context.invalidate()
         return self.deformers_get(verbose=None, method=method) 
         
         
@@ -992,15 +879,14 @@ class Objects():
     @tag('checked')     
     def animation_curves_get(self, verbose=None, method='scene') -> list:
         animation_curves = []
-        nodes = utils.mesh_array(method) + utils.transform_array(method)
+        nodes = self.context.mesh_array(method) + self.context.transform_array(method)
         if nodes:
+            graph = self.context.graph()
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Animation Curves: {node}"): return None
-                    try:
-                        for anim_curve in utils.noneAsList(cmds.listConnections(node, type="animCurve")):
-                            if anim_curve not in animation_curves_nodes: animation_curves_nodes.append(anim_curve)       
-                    except: pass
+                    for anim_curve in graph.neighbours(self.context.full_path(node)):
+                        if graph.inherits(anim_curve, 'animCurve') and anim_curve not in animation_curves: animation_curves.append(anim_curve)
         return animation_curves
         
     def animation_curves_fix(self, verbose=None, method='scene') -> list:
@@ -1014,6 +900,7 @@ class Objects():
                         cmds.delete(node)
                     except:
                         logger.info('- unable to remove "%s".'%node)           
+        self.context.invalidate()
         return self.animation_curves_get(verbose=None, method=method) 
             
         
@@ -1021,7 +908,7 @@ class Objects():
     @tag('checked')     
     def enable_overrides_get(self, verbose=None, method='scene') -> list:
         enable_overrides = []
-        nodes = utils.mesh_array(method) + utils.transform_array(method)
+        nodes = self.context.mesh_array(method) + self.context.transform_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -1032,7 +919,7 @@ class Objects():
                         if node not in enable_overrides: enable_overrides.append(node)
                     elif cmds.getAttr(f"{node}.overrideLevelOfDetail") != 0:
                         if node not in enable_overrides: enable_overrides.append(node)
-                    for shape in utils.noneAsList(cmds.listRelatives(node, shapes=True, fullPath=True)):
+                    for shape in self.context.shapes(node):
                         if cmds.getAttr(f"{shape}.overrideEnabled") != 0:
                             if shape not in enable_overrides: enable_overrides.append(shape)
                         elif cmds.getAttr(f"{shape}.overrideDisplayType") != 0:
@@ -1056,19 +943,21 @@ class Objects():
                     cmds.setAttr(f"{node}.overrideVisibility", 1)
                     cmds.setAttr(f"{node}.overrideRGBColors", 0)
                     cmds.setAttr(f"{node}.overrideColor", 0)
+        self.context.invalidate()
         return self.enable_overrides_get(verbose=None, method=method)            
                     
 
     # -------------  
     @tag('checked')     
+    @tag('edits')
     def smooth_mesh_preview_get(self, verbose=None, method='scene') -> list:
         is_smoothed = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Smoothed Meshs: {node}"): return None
-                    for shape in utils.noneAsList(cmds.listRelatives(node, shapes=True)):
+                    for shape in self.context.shapes(node):
                         for attribute in ['displaySubdComps', 'smoothLevel', 'useSmoothPreviewForRender', 'renderSmoothLevel']:
                             try :cmds.setAttr(f"{shape}.{attribute}", 1)
                             except: pass
@@ -1082,8 +971,9 @@ class Objects():
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Fix Smoothed Meshs: {node}"): return None
-                    for shape in utils.noneAsList(cmds.listRelatives(node, shapes=True)):
+                    for shape in self.context.shapes(node):
                         cmds.setAttr(f"{shape}.displaySmoothMesh", 0)
+        self.context.invalidate()
         return self.smooth_mesh_preview_get(verbose=None, method=method)
     
     
@@ -1091,12 +981,12 @@ class Objects():
     @tag('checked')     
     def smooth_mesh_preview_get(self, verbose=None, method='scene') -> list:
         is_smoothed = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Smoothed Meshs: {node}"): return None
-                    for shape in utils.noneAsList(cmds.listRelatives(node, shapes=True, fullPath=True)):
+                    for shape in self.context.shapes(node):
                         if cmds.getAttr(f"{shape}.displaySmoothMesh")         != 0 and node not in is_smoothed: is_smoothed.append(node)
                         if cmds.getAttr(f"{shape}.displaySubdComps")          != 1 and node not in is_smoothed: is_smoothed.append(node)
                         if cmds.getAttr(f"{shape}.smoothLevel")               != 1 and node not in is_smoothed: is_smoothed.append(node)
@@ -1110,12 +1000,13 @@ class Objects():
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Fix Smoothed Meshs: {node}"): return None
-                    for shape in utils.noneAsList(cmds.listRelatives(node, shapes=True)):
+                    for shape in self.context.shapes(node):
                         cmds.setAttr(f"{shape}.displaySmoothMesh", 0)
                         cmds.setAttr(f"{shape}.displaySubdComps", 1)
                         cmds.setAttr(f"{shape}.smoothLevel", 1)
                         cmds.setAttr(f"{shape}.useSmoothPreviewForRender", 1)
                         cmds.setAttr(f"{shape}.renderSmoothLevel", 1)
+        self.context.invalidate()
         return self.smooth_mesh_preview_get(verbose=None, method=method)
         
         
@@ -1123,12 +1014,12 @@ class Objects():
     @tag('checked')     
     def floating_rock_model_tag_get(self, verbose=None, method='scene') -> list:
         is_not_tagged = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Tagged Meshs: {node}"): return None
-                    for shape in utils.noneAsList(cmds.listRelatives(node, shapes=True)):
+                    for shape in self.context.shapes(node):
                         if not cmds.attributeQuery('mdl_path', node=shape, exists=True) and node not in is_not_tagged:
                             is_not_tagged.append(node)
         return is_not_tagged
@@ -1142,131 +1033,99 @@ class Objects():
                 with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                     for i, node in enumerate(nodes):
                         if not prog.update(f"Fix Tagged Meshs: {node}"): return None
-                        fr_tag_geo_for_USD.main.fr_tag_geo_for_USD(utils.noneAsList(cmds.listRelatives(node, shapes=True)))
+                        fr_tag_geo_for_USD.main.fr_tag_geo_for_USD(self.context.shapes(node))
             except Exception as e:
                 logger.warning(f'- unable to fix the floating rock meshs tags. {e}')
                 
+        self.context.invalidate()
         return self.floating_rock_model_tag_get(verbose=None, method=method)        
     
         
 class Topology():
-    def __init__(self):
-        pass
+    # component and mask of every predicate that can be evaluated on a meshdata.MeshData.
+    PREDICATES = {
+        'triangles_get':            ('f',   lambda data, **options: data.face_counts == 3),
+        'ngons_get':                ('f',   lambda data, **options: data.face_counts > 4),
+        'laminas_faces_get':        ('f',   lambda data, **options: data.lamina_faces),
+        'zero_areas_faces_get':     ('f',   lambda data, **options: data.face_areas <= 0.00000001),
+        'non_manifolds_edges_get':  ('e',   lambda data, **options: data.edge_face_counts > 2),
+        'zero_length_edges_get':    ('e',   lambda data, **options: data.edge_lengths <= 0.00000001),
+        'hard_edges_get':           ('e',   lambda data, **options: ~data.smooth_edges & (data.edge_face_counts != 1)),
+        'open_edges_get':           ('e',   lambda data, **options: data.edge_face_counts < 2),
+        'poles_get':                ('vtx', lambda data, **options: data.vertex_valences > options.get('valence', meshdata.POLE_VALENCE)),
+        'starlikes_get':            ('f',   lambda data, **options: ~data.starlike_faces),
+    }
+    
+    def __init__(self, context=None, undo=None):
+        self.context = context if context is not None else runtime.RunContext()
+        self.undo = undo if undo is not None else not cmds.about(batch=True)
+        
+        
+    def run_fused(self, methods=None, verbose=None, method='scene', **options) -> dict:
+        """
+        Evaluate every given predicate in a single pass over the meshs, each mesh being extracted once.
+        options are handed to every predicate. ex: valence=6 for poles_get.
+        Return {method name: (errors, seconds)}, per predicate.
+        """
+        methods = [name for name in methods if name in self.PREDICATES]
+        errors, times = {name: [] for name in methods}, {name: 0.0 for name in methods}
+        nodes = self.context.mesh_array(method)
+        if nodes and methods:
+            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
+                for i, node in enumerate(nodes):
+                    if not prog.update(f"Get Topology: {node}"): return None
+                    data = self.context.mesh_data(node)
+                    for name in methods:
+                        start_time = time.perf_counter()
+                        component, predicate = self.PREDICATES[name]
+                        errors[name].extend(components.compact(data.name, component, np.flatnonzero(predicate(data, **options))))
+                        times[name] += time.perf_counter() - start_time
+        return {name: (errors[name], times[name]) for name in methods}
+    
+    def run_predicate(self, name=None, verbose=None, method='scene', **options) -> list:
+        result = self.run_fused([name], verbose=verbose, method=method, **options)
+        return None if result is None else result[name][0]
            
            
     # -------------  
     def triangles_get(self, verbose=None, method='scene') -> list:
-        triangles = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            faceIt = om2.MItMeshPolygon(selIt.getDagPath())
-            fn = om2.MFnDependencyNode(selIt.getDagPath().node())
-            while not faceIt.isDone():
-                numOfEdges = faceIt.getEdges()
-                if len(numOfEdges) == 3:
-                    triangles.append(f"{selIt.getDagPath().fullPathName()}.f[{faceIt.index()}]")
-                faceIt.next()
-            selIt.next()
-        return triangles    
+        return self.run_predicate('triangles_get', verbose=verbose, method=method)
         
 
     # -------------  
     @tag('checked')        
     def ngons_get(self, verbose=None, method='scene') -> list:
-        ngons = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            faceIt = om2.MItMeshPolygon(selIt.getDagPath())
-            fn = om2.MFnDependencyNode(selIt.getDagPath().node())
-            while not faceIt.isDone():
-                numOfEdges = faceIt.getEdges()
-                if len(numOfEdges) > 4:
-                    ngons.append(f"{selIt.getDagPath().fullPathName()}.f[{faceIt.index()}]")
-                faceIt.next()
-            selIt.next()
-        return ngons     
+        return self.run_predicate('ngons_get', verbose=verbose, method=method)
            
            
     # -------------  
     @tag('checked')       
     def laminas_faces_get(self, verbose=None, method='scene') -> list:
-        laminas = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            faceIt = om2.MItMeshPolygon(selIt.getDagPath())
-            fn = om2.MFnDependencyNode(selIt.getDagPath().node())
-            while not faceIt.isDone():
-                laminaFaces = faceIt.isLamina()
-                if laminaFaces is True:
-                    laminas.append(f"{selIt.getDagPath().fullPathName()}.f[{faceIt.index()}]")
-                faceIt.next()
-            selIt.next()
-        return laminas    
+        return self.run_predicate('laminas_faces_get', verbose=verbose, method=method)
 
            
     # -------------  
     @tag('checked')        
     def zero_areas_faces_get(self, verbose=None, method='scene') -> list:
-        zero_areas_faces = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            faceIt = om2.MItMeshPolygon(selIt.getDagPath())
-            fn = om2.MFnDependencyNode(selIt.getDagPath().node())
-            while not faceIt.isDone():
-                faceArea = faceIt.getArea()
-                if faceArea <= 0.00000001:
-                    zero_areas_faces.append(f"{selIt.getDagPath().fullPathName()}.f[{faceIt.index()}]")
-                faceIt.next()
-            selIt.next()
-        return zero_areas_faces    
+        return self.run_predicate('zero_areas_faces_get', verbose=verbose, method=method)
         
            
     # -------------  
     @tag('checked')        
     def non_manifolds_edges_get(self, verbose=None, method='scene') -> list:
-        none_manifold_edges = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            edgeIt = om2.MItMeshEdge(selIt.getDagPath())
-            fn = om2.MFnDependencyNode(selIt.getDagPath().node())
-            while not edgeIt.isDone():
-                if edgeIt.numConnectedFaces() > 2:
-                    none_manifold_edges.append(f"{selIt.getDagPath().fullPathName()}.e[{edgeIt.index()}]")
-                edgeIt.next()
-            selIt.next()
-        return none_manifold_edges
+        return self.run_predicate('non_manifolds_edges_get', verbose=verbose, method=method)
         
            
     # -------------  
     @tag('checked')        
     def zero_length_edges_get(self, verbose=None, method='scene') -> list:
-        zero_length_edges = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            edgeIt = om2.MItMeshEdge(selIt.getDagPath())
-            fn = om2.MFnDependencyNode(selIt.getDagPath().node())
-            while not edgeIt.isDone():
-                if edgeIt.length() <= 0.00000001:
-                    zero_length_edges.append(f"{selIt.getDagPath().fullPathName()}.e[{edgeIt.index()}]")
-                edgeIt.next()
-            selIt.next()
-        return zero_length_edges
+        return self.run_predicate('zero_length_edges_get', verbose=verbose, method=method)
         
         
     # -------------  
     @tag('checked')     
     def hard_edges_get(self, verbose=None, method='scene') -> list:
-        hard_edges = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            edgeIt = om2.MItMeshEdge(selIt.getDagPath())
-            fn = om2.MFnDependencyNode(selIt.getDagPath().node())
-            while not edgeIt.isDone():
-                if edgeIt.isSmooth is False and edgeIt.onBoundary() is False:
-                    hard_edges.append(f"{selIt.getDagPath().fullPathName()}.e[{edgeIt.index()}]")
-                edgeIt.next()
-            selIt.next()
-        return hard_edges
+        return self.run_predicate('hard_edges_get', verbose=verbose, method=method)
     
     #def hard_edges_fix(self, verbose=None, method='scene') -> list:
     #    hard_edges = self.hard_edges_get(verbose=None, method=method)
@@ -1282,54 +1141,24 @@ class Topology():
     # -------------  
     @tag('checked')        
     def open_edges_get(self, verbose=None, method='scene') -> list:
-        open_edges = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            edgeIt = om2.MItMeshEdge(selIt.getDagPath())
-            fn = om2.MFnDependencyNode(selIt.getDagPath().node())    
-            while not edgeIt.isDone():
-                if edgeIt.numConnectedFaces() < 2:
-                    open_edges.append(f"{selIt.getDagPath().fullPathName()}.e[{edgeIt.index()}]")
-                edgeIt.next()
-            selIt.next()
-        return open_edges
+        return self.run_predicate('open_edges_get', verbose=verbose, method=method)
     
     
     # -------------      
-    def poles_get(self, verbose=None, method='scene') -> list:
-        poles = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            vertexIt = om2.MItMeshVertex(selIt.getDagPath())
-            fn = om2.MFnDependencyNode(selIt.getDagPath().node())
-            while not vertexIt.isDone():
-                if vertexIt.numConnectedEdges() > 5:
-                    poles.append(f"{selIt.getDagPath().fullPathName()}.vtx[{vertexIt.index()}]")
-                vertexIt.next()
-            selIt.next()
-        return poles 
+    def poles_get(self, verbose=None, method='scene', valence=meshdata.POLE_VALENCE) -> list:
+        return self.run_predicate('poles_get', verbose=verbose, method=method, valence=valence)
     
     
     # -------------  
     @tag('checked')        
     def starlikes_get(self, verbose=None, method='scene') -> list:
-        starlikes = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            polyIt = om2.MItMeshPolygon(selIt.getDagPath())
-            fn = om2.MFnDependencyNode(selIt.getDagPath().node())
-            while not polyIt.isDone():
-                if polyIt.isStarlike() is False:
-                    starlikes.append(f"{selIt.getDagPath().fullPathName()}.f[{polyIt.index()}]")
-                polyIt.next()
-            selIt.next()
-        return starlikes 
+        return self.run_predicate('starlikes_get', verbose=verbose, method=method)
     
     # -------------  
     @tag('checked')        
     def invalid_edges_get(self, verbose=None, method='scene') -> list:
         invalid_edges = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -1347,6 +1176,7 @@ class Topology():
                     if not prog.update(f"Fix Invalid Edges: {node}"): return None
                     try: cmds.polyClean(node, cleanEdges=True, constructionHistory=False)
                     except: pass
+        self.context.invalidate()
         return self.invalid_edges_get(verbose=None, method=method)  
     
     
@@ -1354,7 +1184,7 @@ class Topology():
     @tag('checked')        
     def invalid_vertices_get(self, verbose=None, method='scene') -> list:
         invalid_vertices = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -1371,19 +1201,21 @@ class Topology():
                     if not prog.update(f"Fix Invalid Vertices: {node}"): return None
                     try: cmds.polyClean(node, cleanVertices=True, constructionHistory=False)
                     except: pass
+        self.context.invalidate()
         return self.invalid_vertices_get(verbose=None, method=method)                   
                
      
 class UV():
-    def __init__(self):
-        pass   
+    def __init__(self, context=None, undo=None):
+        self.context = context if context is not None else runtime.RunContext()
+        self.undo = undo if undo is not None else not cmds.about(batch=True)
         
         
     # -------------  
     @tag('checked') 
     def empty_uv_get(self, verbose=None, method='scene') -> list:
         empty_uv = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
+        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(self.context.mesh_array(method)))
         while not selIt.isDone():
             faceIt = om2.MItMeshPolygon(selIt.getDagPath())
             fn = om2.MFnDependencyNode(selIt.getDagPath().node())
@@ -1401,7 +1233,7 @@ class UV():
     @tag('checked')        
     def non_manifolds_uvs_get(self, verbose=None, method='scene') -> list:
         non_manifolds_uvs = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
@@ -1418,6 +1250,7 @@ class UV():
                     if not prog.update(f"Fix Non Manifolds Uvs: {node}"): return None
                     try: cmds.polyClean(node, cleanUVs=True, constructionHistory=False)
                     except: pass
+        self.context.invalidate()
         return self.non_manifolds_uvs_get(verbose=None, method=method)
             
             
@@ -1425,20 +1258,9 @@ class UV():
     @tag('checked')     
     def negative_uv_get(self, verbose=None, method='scene') -> list:
         negative_uv = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            faceIt = om2.MItMeshPolygon(selIt.getDagPath())
-            fn = om2.MFnDependencyNode(selIt.getDagPath().node())
-            while not faceIt.isDone():
-                U, V = set(), set()
-                try:
-                    u, v = faceIt.getUVs()
-                    if min(u) < 0 or min(v) < 0:
-                        negative_uv.append(f"{selIt.getDagPath().fullPathName()}.f[{faceIt.index()}]")
-                    faceIt.next()        
-                except:
-                    faceIt.next()
-            selIt.next()
+        for node in self.context.mesh_array(method):
+            data = self.context.mesh_data(node)
+            negative_uv.extend(components.compact(data.name, 'f', np.flatnonzero(np.any(data.uv_face_min < 0, axis=1))))
         return negative_uv
     
         
@@ -1446,7 +1268,7 @@ class UV():
     @tag('checked')     
     def multiple_uv_sets_get(self, verbose=None, method='scene') -> list:
         multiple_uv_sets = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
+        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(self.context.mesh_array(method)))
         while not selIt.isDone():
             try:
                 faceIt = om2.MItMeshPolygon(selIt.getDagPath())
@@ -1465,7 +1287,7 @@ class UV():
     @tag('checked')     
     def missing_uv_sets_get(self, verbose=None, method='scene') -> list:
         missing_uv_sets = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
+        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(self.context.mesh_array(method)))
         while not selIt.isDone():
             try:
                 faceIt = om2.MItMeshPolygon(selIt.getDagPath())
@@ -1484,122 +1306,70 @@ class UV():
     @tag('checked')     
     def multiple_udims_get(self, verbose=None, method='scene') -> list:
         multiple_udims = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            faceIt = om2.MItMeshPolygon(selIt.getDagPath())
-            fn = om2.MFnDependencyNode(selIt.getDagPath().node())
-            while not faceIt.isDone():
-                U, V = set(), set()
-                try:
-                    UVs = faceIt.getUVs()
-                    Us, Vs, = UVs[0], UVs[1]
-                    for i in range(len(Us)):
-                        U.add(int(Us[i]) if Us[i] > 0 else int(Us[i]) - 1)
-                        V.add(int(Vs[i]) if Vs[i] > 0 else int(Vs[i]) - 1)
-                    if len(U) > 1 or len(V) > 1:
-                        multiple_udims.append(f"{selIt.getDagPath().fullPathName()}.f[{faceIt.index()}]")
-                    faceIt.next()
-                except:
-                    faceIt.next()
-            selIt.next()
+        for node in self.context.mesh_array(method):
+            data = self.context.mesh_data(node)
+            tiles = np.floor(data.uv_face_min)
+            multiple_udims.extend(components.compact(data.name, 'f', np.flatnonzero(np.any(data.uv_face_max - tiles > 1, axis=1))))
         return multiple_udims
         
         
     # -------------  
     def flipped_uv_faces_get(self, verbose=None, method='scene') -> list:
         flipped_uv_faces = []
-        selIt = om2.MItSelectionList(utils.list_as_MSelectionList(utils.mesh_array(method)))
-        while not selIt.isDone():
-            try:
-                faceIt = om2.MItMeshPolygon(selIt.getDagPath())
-                fn = om2.MFnMesh(selIt.getDagPath())
-                u, v = fn.getUVs()
-                while not faceIt.isDone():
-                    poly_verts = fn.getPolygonVertices(faceIt.index())
-                    pvc = len(poly_verts)
-                    u_coo, v_coo = [], []
-                    for vtx in range(pvc):
-                        uv_indices = int(fn.getPolygonUVid(faceIt.index(), vtx))
-                        u_coo.append(u[uv_indices])
-                        v_coo.append(v[uv_indices])   
-                    uv_a = [u_coo[0], v_coo[0]]
-                    uv_b = [u_coo[1], v_coo[1]]
-                    uv_c = [u_coo[2], v_coo[2]]
-                    uvAB = om2.MVector([uv_b[0]-uv_a[0], uv_b[1]-uv_a[1]])
-                    uvBC = om2.MVector([uv_c[0]-uv_b[0], uv_c[1]-uv_b[1]])
-                    if (uvAB ^ uvBC) * om2.MVector(0, 0, 1) < 0:
-                        flipped_uv_faces.append(f"{selIt.getDagPath().fullPathName()}.f[{faceIt.index()}]")
-                    faceIt.next()
-            except:
-                selIt.next()
-            selIt.next()
-        return flipped_uv_faces  
+        for node in self.context.mesh_array(method):
+            data = self.context.mesh_data(node)
+            flipped_uv_faces.extend(components.compact(data.name, 'f', np.flatnonzero(data.uv_face_areas < 0)))
+        return flipped_uv_faces
         
         
     # -------------  
     def overlapping_uv_faces_get(self, verbose=None, method='scene') -> list:
         overlapping_uv_faces = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Overlapping UV Faces: {node}"): return None
-                    shapes = cmds.listRelatives(node, shapes=True)
-                    if shapes:
-                        overlapping_uv_faces.extend(utils.noneAsList(cmds.polyUVOverlap("{}.f[*]".format(shapes[0]), overlappingComponents=True)))
+                    for mesh, faces in overlap.overlapping_faces([(self.context.mesh_data(node), None)]).items():
+                        overlapping_uv_faces.extend(components.compact(mesh, 'f', faces))
         return overlapping_uv_faces
         
         
     # -------------  
     def overlapping_uv_meshs_get(self, verbose=None, method='scene') -> list:
         overlapping_uv_meshs = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         data = {}
         if nodes:
-            with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
-                for i, node in enumerate(nodes):
-                    if not prog.update(f"Get Meshs Per Shaders: {node}"): return None
-                    dag = om2.MGlobal.getSelectionListByName(node).getDagPath(0)
-                    mfn = om2.MFnMesh(dag.extendToShape())
-                    for shader in mfn.getConnectedShaders(0)[0]:
-                        shader_name = om2.MFnDependencyNode(shader).name()
-                        
-                        if shader_name not in list(data.keys()):
-                            data[shader_name] = []
-                        for child in str(om2.MFnSet(shader).getMembers(1).getSelectionStrings()).replace("(","").replace(")","").replace("'","").replace(",","").rsplit(" "):
-                            data[shader_name].extend(cmds.polyListComponentConversion(child, toFace=True))
+            for engine, members in self.context.shading_index(method).members.items():
+                data[engine] = [(self.context.mesh_data(node), faces) for node, faces in members]
         if data:
             with progress.ProgressWindow(len(list(data.keys())), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(list(data.keys())):
                     if not prog.update(f"Get Overlapping UV Meshs: {node}"): return None
-                    overlapping_uv_meshs.extend(utils.noneAsList(cmds.polyUVOverlap(data[node], overlappingComponents=True)))
+                    for mesh, faces in overlap.overlapping_faces(data[node]).items():
+                        overlapping_uv_meshs.extend(components.compact(mesh, 'f', faces))
                     
         return overlapping_uv_meshs
         
 
      
 class Shaders():
-    def __init__(self):
-        pass
+    def __init__(self, context=None, undo=None):
+        self.context = context if context is not None else runtime.RunContext()
+        self.undo = undo if undo is not None else not cmds.about(batch=True)
     
     
     # -------------  
     def assigned_lambert_get(self, verbose=None, method='scene') -> list:
         non_lambert = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
+            index = self.context.shading_index(method)
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Assigned Shader: {node}"): return None
-                    dag = om2.MGlobal.getSelectionListByName(node).getDagPath(0)
-                    mfn = om2.MFnMesh(dag.extendToShape())
-                    if mfn.getConnectedShaders(0):
-                        is_lambert = True
-                        for engine in mfn.getConnectedShaders(0)[0]:
-                            if engine.apiType() == om2.MFn.kShadingEngine:
-                                if om2.MFnDependencyNode(engine).name() != 'initialShadingGroup':
-                                    is_lambert = None
-                        if not is_lambert: non_lambert.append(node)
+                    if any(engine != 'initialShadingGroup' for engine in index.engines[node]): non_lambert.append(node)
         return non_lambert
         
     def assigned_lambert_fix(self, verbose=None, method='scene') -> list:
@@ -1609,6 +1379,7 @@ class Shaders():
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Fix Assigned Shaders: {node}"): return None
                     cmds.sets(f'{node}', edit=True, forceElement='initialShadingGroup')
+        self.context.invalidate()
         return self.assigned_lambert_get(verbose=None,  method=method)  
         
         
@@ -1616,37 +1387,38 @@ class Shaders():
     # -------------  
     def assigned_faces_shaders_get(self, verbose=None, method='scene') -> list:
         non_assigned_faces_shaders = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
+            index = self.context.shading_index(method)
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Unassigned Faces: {node}"): return None
-                    dag = om2.MGlobal.getSelectionListByName(node).getDagPath(0)
-                    mfn = om2.MFnMesh(dag.extendToShape())
-                    for shader in mfn.getConnectedShaders(0)[0]:
-                        for child in str(om2.MFnSet(shader).getMembers(1).getSelectionStrings()).replace("(","").replace(")","").replace("'","").replace(",","").rsplit(" "):
-                            if child not in ['shaderBallGeomShape1']:
-                                if not child.count('.f[') and node not in non_assigned_faces_shaders: non_assigned_faces_shaders.append(node)
+                    if self.context.mesh_data(node).name.rsplit('|')[-1] in shading.IGNORED_SHAPES: continue
+                    if index.object_members[node]: non_assigned_faces_shaders.append(node)
         return non_assigned_faces_shaders
         
     def assigned_faces_shaders_fix(self, verbose=None, method='scene') -> list:
         nodes = self.assigned_faces_shaders_get(verbose=None,  method=method)
         if nodes:
+            index = self.context.shading_index(method)
+            removals, additions = {}, {}
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Fix Unassigned Faces: {node}"): return None
-                    dag = om2.MGlobal.getSelectionListByName(node).getDagPath(0)
-                    mfn = om2.MFnMesh(dag.extendToShape())
-                    for shader in mfn.getConnectedShaders(0)[0]:
-                        if shader.apiType() == om2.MFn.kShadingEngine:
-                            childs = om2.MFnSet(shader).getMembers(1)
-                            new_childs = om2.MSelectionList()
-                            for child in str(childs.getSelectionStrings()).replace("(","").replace(")","").replace("'","").replace(",","").rsplit(" "):
-                                if child not in ['shaderBallGeomShape1']: 
-                                    for face in utils.noneAsList(cmds.polyListComponentConversion(child, toFace=True)): new_childs.add(face)
-
-                            om2.MFnSet(shader).removeMembers(childs)    
-                            om2.MFnSet(shader).addMembers(new_childs)
+                    dag = self.context.mesh_data(node).dag_path
+                    for engine in index.object_members[node]:
+                        removals.setdefault(engine, om2.MSelectionList()).add(dag)
+                        faces = index.faces(node, engine)
+                        if faces.size:
+                            component = om2.MFnSingleIndexedComponent()
+                            component_object = component.create(om2.MFn.kMeshPolygonComponent)
+                            component.addElements(faces.tolist())
+                            additions.setdefault(engine, om2.MSelectionList()).add((dag, component_object))
+            for engine, childs in removals.items():
+                fn = om2.MFnSet(om2.MGlobal.getSelectionListByName(engine).getDependNode(0))
+                fn.removeMembers(childs)
+                if engine in additions: fn.addMembers(additions[engine])
+        self.context.invalidate()
         return self.assigned_faces_shaders_get(verbose=None,  method=method) 
     
     
@@ -1654,14 +1426,13 @@ class Shaders():
     # -------------  
     def non_shaders_assigned_get(self, verbose=None, method='scene') -> list:
         non_shaders = []
-        nodes = utils.mesh_array(method)
+        nodes = self.context.mesh_array(method)
         if nodes:
+            index = self.context.shading_index(method)
             with progress.ProgressWindow(len(nodes), enable=verbose if not cmds.about(batch=True) else None , title="Mesh Checker") as prog:
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Get Unassigned Meshs: {node}"): return None
-                    dag = om2.MGlobal.getSelectionListByName(node).getDagPath(0)
-                    mfn = om2.MFnMesh(dag.extendToShape())
-                    if len(mfn.getConnectedShaders(0)[0]) == 0:
+                    if len(index.engines[node]) == 0:
                         non_shaders.append(node)
         return non_shaders
     
@@ -1672,4 +1443,5 @@ class Shaders():
                 for i, node in enumerate(nodes):
                     if not prog.update(f"Fix Non Shader Assigned Meshs: {node}"): return None
                     cmds.sets(f'{node}', edit=True, forceElement='initialShadingGroup')
+        self.context.invalidate()
         return self.non_shaders_assigned_get(verbose=None, method=method)  
\ No newline at end of file
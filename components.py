@@ -0,0 +1,79 @@
+"""
+CHECKER. (c)
+
+Author:  Gregoire Dehame
+Created: Oct 18, 2026
+Module:  checker.components
+Purpose: compact component results, a mesh path and an index array encoded to maya ranges on demand.
+Execute: from checker import components; components.Components('|pCube1|pCubeShape1', 'f', [0, 1, 2])
+"""
+
+try:
+    import numpy as np
+except: pass
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+from . import meshdata
+
+
+class Components(object):
+    """
+    Components of a single mesh, stored as its path and a sorted unique index array instead of
+    one string per component. len() and count() never expand anything, ranges() encodes maya
+    range strings once, and iterating yields them. ex: '|pCube1|pCubeShape1.f[0:2]'.
+    """
+    def __init__(self, path=None, component='f', indices=None):
+        self.path = path
+        self.component = component
+        self.indices = np.unique(np.asarray(indices, dtype=np.int64))
+        self._ranges = None
+
+    def __len__(self) -> int:
+        return int(self.indices.size)
+
+    def __iter__(self):
+        return iter(self.ranges())
+
+    def __str__(self) -> str:
+        return ' '.join(self.ranges())
+
+    def __repr__(self) -> str:
+        return f"Components('{self.path}', '{self.component}', {len(self)})"
+
+    def count(self) -> int:
+        return len(self)
+
+    def ranges(self) -> list:
+        if self._ranges is None:
+            self._ranges = meshdata.component_ranges(self.path, self.component, self.indices)
+        return self._ranges
+
+
+def compact(path=None, component='f', indices=None) -> list:
+    """
+    Return a single Components result for the given indices, or nothing when there are none,
+    so checks can extend their results with it.
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    return [Components(path, component, indices)] if indices.size else []
+
+
+def expand(results=None) -> list:
+    """
+    Return every result as plain strings, encoding Components into their maya ranges.
+    """
+    strings = []
+    for result in results:
+        if isinstance(result, Components): strings.extend(result.ranges())
+        else:                              strings.append(result)
+    return strings
+
+
+def count(results=None) -> int:
+    """
+    Return the number of erroneous nodes and components of results, without encoding anything.
+    """
+    return sum(len(result) if isinstance(result, Components) else 1 for result in results)
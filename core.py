@@ -19,7 +19,7 @@ import os
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-from . import utils, commands, printter, highlighter
+from . import utils, commands, printter, runtime, scope, messages, components, results
 
 class CheckerManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
     """ project manager interface class.
@@ -38,6 +38,7 @@ class CheckerManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
         self.clr_negative = '153, 102, 102'
         self.all_run_actions = {}
         self.all_fix_actions = {}
+        self.results = results.ResultStore()
         
         self.icons = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons')
         self.setObjectName(f"{CheckerManager.title}")
@@ -58,14 +59,27 @@ class CheckerManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
         self.method_1 = QtWidgets.QAction("Selected Objects")
         self.method_2 = QtWidgets.QAction("Selected Top Node")
         self.method_3 = QtWidgets.QAction("Scene")
+        self.method_4 = QtWidgets.QAction("Object Set")
+        self.method_5 = QtWidgets.QAction("Namespace")
+        self.method_6 = QtWidgets.QAction("Display Layer")
         self.method_1.setCheckable(True)
         self.method_2.setCheckable(True)
         self.method_3.setCheckable(True)
+        self.method_4.setCheckable(True)
+        self.method_5.setCheckable(True)
+        self.method_6.setCheckable(True)
         self.method_group = QtWidgets.QActionGroup(self.preferences)
         self.method_group.addAction(self.method_1)
         self.method_group.addAction(self.method_2)
         self.method_group.addAction(self.method_3)
+        self.method_group.addAction(self.method_4)
+        self.method_group.addAction(self.method_5)
+        self.method_group.addAction(self.method_6)
         self.method_3.setChecked(True)
+        self.scope_names = {}
+        self.method_4.triggered.connect(partial(self.change_scope_name, scope_type='set', action=self.method_4))
+        self.method_5.triggered.connect(partial(self.change_scope_name, scope_type='namespace', action=self.method_5))
+        self.method_6.triggered.connect(partial(self.change_scope_name, scope_type='layer', action=self.method_6))
         self.verbose =  QtWidgets.QAction("Verbose", checkable=True)
         self.verbose.setChecked(True)
         self.success =  QtWidgets.QAction("Show Success", checkable=True)
@@ -85,6 +99,9 @@ class CheckerManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
         self.preferences.addAction(self.method_1)
         self.preferences.addAction(self.method_2)
         self.preferences.addAction(self.method_3)
+        self.preferences.addAction(self.method_4)
+        self.preferences.addAction(self.method_5)
+        self.preferences.addAction(self.method_6)
         self.preferences.addSection('Results')
         self.preferences.addAction(self.verbose)
         self.preferences.addAction(self.success)
@@ -136,12 +153,17 @@ class CheckerManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
                 key_layout.addWidget(self.group_box(key, module[key]))
                 self.left_scroll_panel_layout.addWidget(key_frame)
         
-        self.print_editor = printter.Editor()
-        self.print_editor.setReadOnly(True)
-        highlighter.PythonHighlighter(self.print_editor.document())
+        self.report_view = printter.ReportView()
+        self.nodes.toggled.connect(self.report_view.model().set_show_nodes)
+        self.report_filter = printter.ReportFilter(self.report_view.model())
+        self.report_widget = QtWidgets.QWidget()
+        self.report_layout = QtWidgets.QVBoxLayout(self.report_widget)
+        self.report_layout.setContentsMargins(0,0,0,0)
+        self.report_layout.addWidget(self.report_filter)
+        self.report_layout.addWidget(self.report_view)
         self.splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
         self.splitter.addWidget(self.left_scroll_area)
-        self.splitter.addWidget(self.print_editor)
+        self.splitter.addWidget(self.report_widget)
         self.splitter.setHandleWidth(8)
         
         self.bot_widget = QtWidgets.QWidget()
@@ -225,7 +247,7 @@ class CheckerManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
                 children_sel.setStyleSheet("background-color: rgb(93, 93, 93);")
                 children_sel.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
                 children_sel.setEnabled(False)
-                children_sel.clicked.connect(partial(self.select_error_nodes, children_sel))
+                children_sel.clicked.connect(partial(self.select_error_nodes, children))
                 children_layout.setColumnStretch(3, 1)
                 children_layout.addWidget(children_sel, 0 , 3)
                 if children.replace('_get','_fix') in childrens:
@@ -302,25 +324,27 @@ class CheckerManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
             self.clean_report()
 
         commands_reload = importlib.reload(commands)
+        run_context = runtime.RunContext()
         method, checkbox, widget, run_button, sel_button, fix_button = methods
         class_import = getattr(commands_reload, clsmethod)
         if hasattr(class_import, method):
-            class_import = class_import()
+            class_import = class_import(context=run_context, undo=True)
             if checkbox.isChecked():
                 widget.setStyleSheet(f"background-color: rgb({self.clr_process});")
                 start_time = time.perf_counter()
                 func = getattr(class_import, method)
                 errors = utils.noneAsList(func(verbose=self.verbose.isChecked(), method=self.query_method()))
+                if method in commands_reload.tag._dict.get('edits', []): run_context.invalidate()
                 if len(errors) == 0:
                     widget.setStyleSheet(f"background-color: rgb({self.clr_positive});")
                     [bttn.setEnabled(False) for bttn in [sel_button, fix_button]]
-                    sel_button.setToolTip('')
+                    self.results.store(method, [])
                 else:
                     widget.setStyleSheet(f"background-color: rgb({self.clr_negative});")
                     [bttn.setEnabled(True) for bttn in [sel_button, fix_button]]
-                    sel_button.setToolTip(str(errors))
+                    self.results.store(method, errors)
                 
-                self.add_print_editor(function=utils.method_to_title(method), errors=errors, time=(time.perf_counter() - start_time))
+                self.add_report(function=utils.method_to_title(method), method=method, errors=errors, time=(time.perf_counter() - start_time))
     
     
     def single_fix(self, clsmethod=None, methods=None, sections=None):
@@ -328,51 +352,75 @@ class CheckerManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
             self.clean_report()
             
         commands_reload = importlib.reload(commands)
+        run_context = runtime.RunContext()
         method, widget, run_button, sel_button, fix_button = methods
         class_import = getattr(commands_reload, clsmethod)
         if hasattr(class_import, method):
-            class_import = class_import()
+            class_import = class_import(context=run_context, undo=True)
             if fix_button.isEnabled():
                 widget.setStyleSheet(f"background-color: rgb({self.clr_process});")
                 start_time = time.perf_counter()
                 func = getattr(class_import, method)
                 errors = utils.noneAsList(func(verbose=self.verbose.isChecked(), method=self.query_method()))
+                run_context.invalidate()
                 if len(errors) == 0:
                     widget.setStyleSheet(f"background-color: rgb({self.clr_positive});")
                     [bttn.setEnabled(False) for bttn in [sel_button, fix_button]]
-                    sel_button.setToolTip('')
+                    self.results.store(method, [])
                 else:
                     widget.setStyleSheet(f"background-color: rgb({self.clr_negative});")
                     [bttn.setEnabled(True) for bttn in [sel_button, fix_button]]
-                    sel_button.setToolTip(str(errors))
+                    self.results.store(method, errors)
                     
-                self.add_print_editor(function=utils.method_to_title(method), errors=errors, time=(time.perf_counter() - start_time))
+                self.add_report(function=utils.method_to_title(method), method=method, errors=errors, time=(time.perf_counter() - start_time))
                     
 
+    def fused_run(self, commands_module=None, clsmethod=None, methods=None, run_context=None) -> dict:
+        """
+        Evaluate every enabled check of a section supporting it in a single pass over the meshs.
+        Return {method: (errors, seconds)}, empty when the section runs check by check.
+        Run it when the section is reached, so checks editing the scene before it are accounted for.
+        """
+        class_import = getattr(commands_module, clsmethod)
+        if not hasattr(class_import, 'run_fused'): return {}
+        methods = [method for method in methods if method in class_import.PREDICATES]
+        if len(methods) < 2: return {}
+        return class_import(context=run_context, undo=True).run_fused(methods, verbose=self.verbose.isChecked(), method=self.query_method()) or {}
+        
+        
     def section_run(self, clsmethod=None, methods=None, sections=None):
         if self.auto_erase.isChecked():
             self.clean_report()
             
         commands_reload = importlib.reload(commands)
+        run_context = runtime.RunContext()
+        fused = self.fused_run(commands_reload, clsmethod, [method for method, checkbox, *_ in methods if checkbox.isChecked()], run_context)
         for method, checkbox, widget, run_button, sel_button, fix_button in methods:
             class_import = getattr(commands_reload, clsmethod)
             if hasattr(class_import, method):
-                class_import = class_import()
+                class_import = class_import(context=run_context, undo=True)
                 if checkbox.isChecked():
                     widget.setStyleSheet(f"background-color: rgb({self.clr_process});")
                     start_time = time.perf_counter()
-                    func = getattr(class_import, method)
-                    errors = utils.noneAsList(func(verbose=self.verbose.isChecked(), method=self.query_method()))
+                    if method in fused:
+                        errors, elapsed = fused[method]
+                        start_time = time.perf_counter() - elapsed
+                    else:
+                        func = getattr(class_import, method)
+                        errors = utils.noneAsList(func(verbose=self.verbose.isChecked(), method=self.query_method()))
+                    if method in commands_reload.tag._dict.get('edits', []):
+                        run_context.invalidate()
+                        fused = {}
                     if len(errors) == 0:
                         widget.setStyleSheet(f"background-color: rgb({self.clr_positive});")
                         [bttn.setEnabled(False) for bttn in [sel_button, fix_button]]
-                        sel_button.setToolTip('')
+                        self.results.store(method, [])
                     else:
                         widget.setStyleSheet(f"background-color: rgb({self.clr_negative});")
                         [bttn.setEnabled(True) for bttn in [sel_button, fix_button]]
-                        sel_button.setToolTip(str(errors))
+                        self.results.store(method, errors)
                         
-                    self.add_print_editor(function=utils.method_to_title(method), errors=errors, time=(time.perf_counter() - start_time))
+                    self.add_report(function=utils.method_to_title(method), method=method, errors=errors, time=(time.perf_counter() - start_time))
                 
    
     def section_fix(self, clsmethod=None, methods=None, sections=None):
@@ -380,25 +428,27 @@ class CheckerManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
             self.clean_report()
             
         commands_reload = importlib.reload(commands)
+        run_context = runtime.RunContext()
         for method, widget, run_button, sel_button, fix_button in methods:
             class_import = getattr(commands_reload, clsmethod)
             if hasattr(class_import, method):
-                class_import = class_import()
+                class_import = class_import(context=run_context, undo=True)
                 if fix_button.isEnabled():
                     widget.setStyleSheet(f"background-color: rgb({self.clr_process});")
                     start_time = time.perf_counter()
                     func = getattr(class_import, method)
                     errors = utils.noneAsList(func(verbose=self.verbose.isChecked(), method=self.query_method()))
+                    run_context.invalidate()
                     if len(errors) == 0:
                         widget.setStyleSheet(f"background-color: rgb({self.clr_positive});")
                         [bttn.setEnabled(False) for bttn in [sel_button, fix_button]]
-                        sel_button.setToolTip('')
+                        self.results.store(method, [])
                     else:
                         widget.setStyleSheet(f"background-color: rgb({self.clr_negative});")
                         [bttn.setEnabled(True) for bttn in [sel_button, fix_button]]
-                        sel_button.setToolTip(str(errors))
+                        self.results.store(method, errors)
                         
-                    self.add_print_editor(function=utils.method_to_title(method), errors=errors, time=(time.perf_counter() - start_time))       
+                    self.add_report(function=utils.method_to_title(method), method=method, errors=errors, time=(time.perf_counter() - start_time))       
                         
     
     def run_all(self):
@@ -406,26 +456,39 @@ class CheckerManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
             self.clean_report()
             
         commands_reload = importlib.reload(commands)  
+        run_context = runtime.RunContext()
+        fused, fused_sections = {}, set()
         for key in list(self.all_run_actions.keys()):
             clsmethod, method, checkbox, widget, run_button, sel_button, fix_button = self.all_run_actions[key]
             class_import = getattr(commands_reload, clsmethod)
             if hasattr(class_import, method):
-                class_import = class_import()
+                class_import = class_import(context=run_context, undo=True)
                 if checkbox.isChecked():
+                    if clsmethod not in fused_sections:
+                        fused_sections.add(clsmethod)
+                        enabled = [method for cls, method, checkbox, *_ in self.all_run_actions.values() if cls == clsmethod and checkbox.isChecked()]
+                        fused = self.fused_run(commands_reload, clsmethod, enabled, run_context)
                     widget.setStyleSheet(f"background-color: rgb({self.clr_process});")
                     start_time = time.perf_counter()
-                    func = getattr(class_import, method)
-                    errors = utils.noneAsList(func(verbose=self.verbose.isChecked(), method=self.query_method()))
+                    if method in fused:
+                        errors, elapsed = fused[method]
+                        start_time = time.perf_counter() - elapsed
+                    else:
+                        func = getattr(class_import, method)
+                        errors = utils.noneAsList(func(verbose=self.verbose.isChecked(), method=self.query_method()))
+                    if method in commands_reload.tag._dict.get('edits', []):
+                        run_context.invalidate()
+                        fused = {}
                     if len(errors) == 0:
                         widget.setStyleSheet(f"background-color: rgb({self.clr_positive});")
                         [bttn.setEnabled(False) for bttn in [sel_button, fix_button]]
-                        sel_button.setToolTip('')
+                        self.results.store(method, [])
                     else:
                         widget.setStyleSheet(f"background-color: rgb({self.clr_negative});")
                         [bttn.setEnabled(True) for bttn in [sel_button, fix_button]]
-                        sel_button.setToolTip(str(errors))
+                        self.results.store(method, errors)
                         
-                    self.add_print_editor(function=utils.method_to_title(method), errors=errors, time=(time.perf_counter() - start_time))
+                    self.add_report(function=utils.method_to_title(method), method=method, errors=errors, time=(time.perf_counter() - start_time))
                 
         
     def fix_all(self):
@@ -433,54 +496,67 @@ class CheckerManager(MayaQWidgetDockableMixin, QtWidgets.QWidget):
             self.clean_report()
             
         commands_reload = importlib.reload(commands)    
+        run_context = runtime.RunContext()
         for key in list(self.all_fix_actions.keys()):
             clsmethod, method, widget, run_button, sel_button, fix_button = self.all_fix_actions[key]
             class_import = getattr(commands_reload, clsmethod)
             if hasattr(class_import, method):
-                class_import = class_import()
+                class_import = class_import(context=run_context, undo=True)
                 if fix_button.isEnabled():
                     widget.setStyleSheet(f"background-color: rgb({self.clr_process});")
                     start_time = time.perf_counter()
                     func = getattr(class_import, method)
                     errors = utils.noneAsList(func(verbose=self.verbose.isChecked(), method=self.query_method()))
+                    run_context.invalidate()
                     if len(errors) == 0:
                         widget.setStyleSheet(f"background-color: rgb({self.clr_positive});")
                         [bttn.setEnabled(False) for bttn in [sel_button, fix_button]]
-                        sel_button.setToolTip('')
+                        self.results.store(method, [])
                     else:
                         widget.setStyleSheet(f"background-color: rgb({self.clr_negative});")
                         [bttn.setEnabled(True) for bttn in [sel_button, fix_button]]
-                        sel_button.setToolTip(str(errors))
+                        self.results.store(method, errors)
                         
-                    self.add_print_editor(function=utils.method_to_title(method), errors=errors, time=(time.perf_counter() - start_time))
+                    self.add_report(function=utils.method_to_title(method), method=method, errors=errors, time=(time.perf_counter() - start_time))
     
     
-    def select_error_nodes(self, *args):
-        utils.select_from_string(args[0].toolTip(), verbose=self.show_failed.isChecked())
+    def select_error_nodes(self, method=None, *args):
+        model = self.report_view.model()
+        if model.query and model.report_index.latest(method) is not None: missing = results.select(model.filtered_results(method))
+        else:                                                             missing = self.results.select([method])
+        if self.show_failed.isChecked() and missing:
+            nodes_message = ''.join(f"{node}\n" for node in missing)
+            messages.warning(title='Warning', buttons=['Confirm'], message_text='Some nodes does not exists anymore.\nUnable to select all nodes.', detailed_text=nodes_message)
 
 
-    def add_print_editor(self, function=None, errors=None, time=None):
-        if len(errors) == 0:
-            if self.success.isChecked():
-                if self.time.isChecked():
-                    self.print_editor.appendPlainText(f"[ SUCCESS ] {function} (%fs)"%time)
-                else:
-                    self.print_editor.appendPlainText(f"[ SUCCESS ] {function}")
+    def add_report(self, function=None, errors=None, time=None, method=None):
+        status, option = (printter.ERROR, self.errors) if errors else (printter.SUCCESS, self.success)
+        if not option.isChecked(): return
+        header = f"[ {status} ] {function} (%fs)"%time if self.time.isChecked() else f"[ {status} ] {function}"
+        text = f"{header} ({components.count(errors)})" if errors else header
+        self.report_view.model().add_check(check=method, title=function, text=text, status=status, errors=errors)
+    
+    
+    def change_scope_name(self, *args, scope_type=None, action=None):
+        title = action.text().split(':')[0]
+        name = messages.choices(title=title, label=f"Check {title}:", options=scope.list_names(scope_type))
+        if name:
+            self.scope_names[scope_type] = name
+            action.setText(f"{title}: {name}")
         else:
-            if self.errors.isChecked():
-                if self.time.isChecked():
-                    self.print_editor.appendPlainText(f"[ ERROR ] {function} (%fs)"%time)
-                else:
-                    self.print_editor.appendPlainText(f"[ ERROR ] {function}")
-                if self.nodes.isChecked():    
-                    [self.print_editor.appendPlainText(f" - '{error}'") for error in errors]
+            self.scope_names.pop(scope_type, None)
+            action.setText(title)
+            self.method_3.setChecked(True)
     
     
     def query_method(self):
         if   self.method_1.isChecked(): return 'selection'
         elif self.method_2.isChecked(): return 'topnode'
         elif self.method_3.isChecked(): return 'scene'
+        elif self.method_4.isChecked(): return f"set:{self.scope_names.get('set', '')}"
+        elif self.method_5.isChecked(): return f"namespace:{self.scope_names.get('namespace', '')}"
+        elif self.method_6.isChecked(): return f"layer:{self.scope_names.get('layer', '')}"
         
         
     def clean_report(self):
-        self.print_editor.clear()
\ No newline at end of file
+        self.report_view.model().clear()
\ No newline at end of file
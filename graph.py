@@ -0,0 +1,160 @@
+"""
+CHECKER. (c)
+
+Author:  Gregoire Dehame
+Created: Oct 18, 2026
+Module:  checker.graph
+Purpose: dependency graph connections snapshot, queried in memory by the checks.
+Execute: from checker import graph; graph.Graph()
+"""
+
+try:
+    import maya.cmds as cmds
+except: pass
+try:
+    import numpy as np
+except: pass
+
+import collections
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+from . import utils
+
+# geometry carrying input attributes followed by upstream, like cmds.listHistory does.
+GEOMETRY_INPUTS = ['inMesh', 'inputPolymesh', 'inputPoly', 'inputMesh', 'inputGeometry', 'originalGeometry', 'inputGeomTarget']
+STOP_TYPES = ['objectSet']
+
+
+def split_plug(plug=None):
+    """
+    Split a plug string into its node and attribute. ex: '|pCube1|pCubeShape1.inMesh' -> ('|pCube1|pCubeShape1', 'inMesh').
+    """
+    node, _, attribute = plug.partition('.')
+    return node, attribute
+
+
+def leaf_attribute(attribute=None) -> str:
+    """
+    Return the last attribute name of an attribute path. ex: 'input[0].inputGeometry' -> 'inputGeometry'.
+    """
+    return attribute.rsplit('.', 1)[-1].split('[')[0]
+
+
+def match_attribute(attribute=None, name=None) -> bool:
+    """
+    Return True when attribute is name itself, one of its elements or one of its children.
+    """
+    return attribute == name or attribute.startswith(f"{name}[") or attribute.startswith(f"{name}.")
+
+
+class Graph(object):
+    """
+    Snapshot of every node of the scene with its type, and of every connection between them,
+    taken with one ls and one listConnections call. Connections are stored as compressed
+    adjacency arrays in both directions:
+        nodes               long names of every node.
+        types               node type of every node.
+        sources             (E,) source node index of every connection.
+        destinations        (E,) destination node index of every connection.
+        source_attributes   source attribute name of every connection.
+        destination_attributes  destination attribute name of every connection.
+    """
+    def __init__(self):
+        listing = utils.noneAsList(cmds.ls(long=True, showType=True))
+        self.nodes, self.types = listing[0::2], listing[1::2]
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self._inherited = {}
+
+        plugs = utils.noneAsList(cmds.listConnections(self.nodes, connections=True, plugs=True, source=True, destination=False, fullNodeName=True)) if self.nodes else []
+        sources, destinations, self.source_attributes, self.destination_attributes = [], [], [], []
+        for destination_plug, source_plug in zip(plugs[0::2], plugs[1::2]):
+            destination, destination_attribute = split_plug(destination_plug)
+            source, source_attribute = split_plug(source_plug)
+            if destination not in self.index or source not in self.index: continue
+            sources.append(self.index[source])
+            destinations.append(self.index[destination])
+            self.source_attributes.append(source_attribute)
+            self.destination_attributes.append(destination_attribute)
+        self.sources = np.array(sources, dtype=np.int64)
+        self.destinations = np.array(destinations, dtype=np.int64)
+
+        # connections sorted by destination, to walk upstream, and by source, to walk downstream.
+        self._upstream_order = np.argsort(self.destinations, kind='stable')
+        self._upstream_offsets = np.concatenate(([0], np.cumsum(np.bincount(self.destinations, minlength=len(self.nodes)))))
+        self._downstream_order = np.argsort(self.sources, kind='stable')
+        self._downstream_offsets = np.concatenate(([0], np.cumsum(np.bincount(self.sources, minlength=len(self.nodes)))))
+
+    def node_type(self, node=None) -> str:
+        return self.types[self.index[node]] if node in self.index else None
+
+    def inherits(self, node=None, types=None) -> bool:
+        """
+        Return True when the node type is, or derives from, one of the given types.
+        """
+        node_type = self.node_type(node)
+        if node_type is None: return False
+        if node_type not in self._inherited:
+            self._inherited[node_type] = set(utils.noneAsList(cmds.nodeType(node_type, inherited=True, isTypeName=True))) | {node_type}
+        return bool(self._inherited[node_type].intersection([types] if isinstance(types, str) else types))
+
+    def _incoming(self, i=None):
+        return self._upstream_order[self._upstream_offsets[i]:self._upstream_offsets[i + 1]]
+
+    def _outgoing(self, i=None):
+        return self._downstream_order[self._downstream_offsets[i]:self._downstream_offsets[i + 1]]
+
+    def sources_of(self, node=None, attribute=None) -> list:
+        """
+        Return the nodes directly connected into node, optionally into a given attribute only.
+        """
+        if node not in self.index: return []
+        edges = [e for e in self._incoming(self.index[node]) if attribute is None or match_attribute(self.destination_attributes[e], attribute)]
+        return list(dict.fromkeys(self.nodes[self.sources[e]] for e in edges))
+
+    def destinations_of(self, node=None, attribute=None) -> list:
+        """
+        Return the nodes node is directly connected into, optionally from a given attribute only.
+        """
+        if node not in self.index: return []
+        edges = [e for e in self._outgoing(self.index[node]) if attribute is None or match_attribute(self.source_attributes[e], attribute)]
+        return list(dict.fromkeys(self.nodes[self.destinations[e]] for e in edges))
+
+    def neighbours(self, node=None) -> list:
+        return list(dict.fromkeys(self.sources_of(node) + self.destinations_of(node)))
+
+    def upstream(self, node=None, attribute=None) -> list:
+        """
+        Return the construction history of node, walked breadth first through the geometry
+        inputs only (GEOMETRY_INPUTS), and stopping at sets and shading engines (STOP_TYPES).
+        attribute restricts the first step to the connections into that attribute.
+        """
+        if node not in self.index: return []
+        visited, result = {self.index[node]}, []
+        queue = collections.deque(self.index[source] for source in self.sources_of(node, attribute))
+        while queue:
+            i = queue.popleft()
+            if i in visited: continue
+            visited.add(i)
+            if self.inherits(self.nodes[i], STOP_TYPES): continue
+            result.append(self.nodes[i])
+            queue.extend(int(self.sources[e]) for e in self._incoming(i) if leaf_attribute(self.destination_attributes[e]) in GEOMETRY_INPUTS)
+        return result
+
+    def reachable(self, roots=None):
+        """
+        Return a (N,) mask of the roots and of every node feeding them, walked upstream one
+        breadth first level at a time, so each connection is visited once.
+            roots: (N,) bool mask of the nodes to start from.
+        """
+        mask = np.array(roots, dtype=bool)
+        frontier = np.flatnonzero(mask)
+        while frontier.size:
+            starts = self._upstream_offsets[frontier]
+            counts = self._upstream_offsets[frontier + 1] - starts
+            positions = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+            sources = np.unique(self.sources[self._upstream_order[positions]])
+            frontier = sources[~mask[sources]]
+            mask[frontier] = True
+        return mask
@@ -0,0 +1,87 @@
+"""
+CHECKER. (c)
+
+Author:  Gregoire Dehame
+Created: Oct 18, 2026
+Module:  checker.hierarchy
+Purpose: array backed dag hierarchy index, built in a single MItDag pass.
+Execute: from checker import hierarchy; hierarchy.Hierarchy()
+"""
+
+try:
+    import maya.api.OpenMaya as om2
+except: pass
+try:
+    import numpy as np
+except: pass
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class Hierarchy(object):
+    """
+    Parent / child index of every dag path of the scene, in depth first order, so every
+    subtree is a contiguous slice starting at its root:
+        paths               long names of every dag path.
+        parents             (N,) parent index of every path, -1 for the world.
+        depths              (N,) depth of every path.
+        is_shape            (N,) True for shapes.
+        is_intermediate     (N,) True for intermediate shapes.
+        descendant_counts   (N,) number of dag paths below every path, counted bottom-up.
+    """
+    def __init__(self):
+        self.paths, self.index, self._shapes = [], {}, {}
+        parents, depths, is_shape, is_intermediate = [], [], [], []
+        stack = []
+        iterator = om2.MItDag(om2.MItDag.kDepthFirst, om2.MFn.kInvalid)
+        while not iterator.isDone():
+            depth = iterator.depth()
+            del stack[depth:]
+            i = len(self.paths)
+            path = iterator.fullPathName()
+            parent = stack[-1] if stack else -1
+            node = iterator.currentItem()
+            shape = node.hasFn(om2.MFn.kShape)
+            self.paths.append(path)
+            self.index[path] = i
+            parents.append(parent)
+            depths.append(depth)
+            is_shape.append(shape)
+            is_intermediate.append(shape and om2.MFnDagNode(node).isIntermediateObject)
+            if shape and parent >= 0: self._shapes.setdefault(parent, []).append(i)
+            stack.append(i)
+            iterator.next()
+
+        self.parents = np.array(parents, dtype=np.int64)
+        self.depths = np.array(depths, dtype=np.int64)
+        self.is_shape = np.array(is_shape, dtype=bool)
+        self.is_intermediate = np.array(is_intermediate, dtype=bool)
+        self.descendant_counts = np.zeros(len(self.paths), dtype=np.int64)
+        for depth in range(int(self.depths.max()) if self.depths.size else 0, 0, -1):
+            level = np.flatnonzero(self.depths == depth)
+            np.add.at(self.descendant_counts, self.parents[level], self.descendant_counts[level] + 1)
+
+    def contains(self, root=None, path=None) -> bool:
+        """
+        Return True when path is root or one of its descendants, read from the subtree slice.
+        """
+        if root not in self.index or path not in self.index: return False
+        i, j = self.index[root], self.index[path]
+        return i <= j <= i + self.descendant_counts[i]
+
+    def subtree(self, root=None, shapes=False) -> list:
+        """
+        Return root and every dag path below it, in depth first order, shapes optionally included.
+        """
+        if root not in self.index: return []
+        i = self.index[root]
+        end = i + int(self.descendant_counts[i]) + 1
+        return [self.paths[j] for j in range(i, end) if shapes or not self.is_shape[j]]
+
+    def descendant_count(self, path=None) -> int:
+        return int(self.descendant_counts[self.index[path]])
+
+    def shapes(self, path=None, intermediate=False) -> list:
+        return [self.paths[i] for i in self._shapes.get(self.index[path], []) if intermediate or not self.is_intermediate[i]]
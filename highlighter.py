@@ -220,3 +220,29 @@ class PythonHighlighter(QtGui.QSyntaxHighlighter):
             return True
         else:
             return False
+
+
+class ReportHighlighter(QtGui.QSyntaxHighlighter):
+    """
+    Highlighter for checker reports, whose lines are only '[ SUCCESS ]' or '[ ERROR ]' headers, node
+    lines being shown by printter.ReportView. Each block is classified by its prefix alone and the
+    block state never changes, so appending to the report only highlights the new blocks. Blocks
+    past max_lines are left plain.
+    """
+    MAX_LINES = 100000
+    PREFIXES = [('[ SUCCESS ]', 'valid'), ('[ ERROR ]', 'unvalid')]
+
+    def __init__(self, parent=None, max_lines=MAX_LINES):
+        super(ReportHighlighter, self).__init__(parent)
+        self.max_lines = max_lines
+        self.prefixes = [(prefix, len(prefix), STYLES[style]) for prefix, style in ReportHighlighter.PREFIXES]
+
+    def highlightBlock(self, text):
+        """
+        Apply the style of the block prefix to the prefix.
+        """
+        if self.max_lines is not None and self.currentBlock().blockNumber() >= self.max_lines: return
+        for prefix, length, style in self.prefixes:
+            if text.startswith(prefix):
+                self.setFormat(0, length, style)
+                return
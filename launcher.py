@@ -8,13 +8,19 @@ Purpose: checker interface standalone launcher file.
 Execute: from checker import launcher; launcher.tool_checker()
 """
 
-from . import core, utils
+from . import core, utils, messages
 
 def tool_checker(area=None):
     """ function that will delete existing tool_checker interface, and will launch new one.
             Args:
                 area (str): - string area where to launch interface
     """
+    try: import numpy
+    except ImportError:
+        messages.critical(title='Missing numpy', buttons=['Confirm'], message_text='checker requires numpy, which this mayapy does not provide.',
+                          informative_text='Install it with: mayapy -m pip install numpy')
+        return None
+        
     window_name = core.CheckerManager.title + 'WorkspaceControl'
     utils.delete_workspace_control(window_name)
     
@@ -0,0 +1,361 @@
+"""
+CHECKER. (c)
+
+Author:  Gregoire Dehame
+Created: Oct 18, 2026
+Module:  checker.meshdata
+Purpose: vectorized mesh topology extraction, one flat numpy array set per mesh.
+Execute: from checker import meshdata; meshdata.MeshData(dag_path)
+"""
+
+try:
+    import maya.cmds as cmds
+    import maya.api.OpenMaya as om2
+except: pass
+try:
+    import numpy as np
+except: pass
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+TWEAK_TOLERANCE = 0.000000000000001
+POLE_VALENCE = 5
+
+
+class MeshData(object):
+    """
+    Pull a mesh once into flat numpy arrays through bulk MFnMesh calls.
+    Every array is extracted on first access and kept for the rest of the run:
+        points          (V, 3) float64 object space positions.
+        face_counts     (F,)   vertex count per face.
+        face_connects   (C,)   vertex ids of every face, face after face.
+        face_offsets    (F,)   start of each face inside face_connects.
+        face_ids        (C,)   face id of every face_connects entry.
+        edge_vertices   (E, 2) vertex ids of every edge, in maya edge order.
+        smooth_edges    (E,)   True for soft edges.
+        uvs             (U, 2) uv positions of the current uv set.
+        uv_counts       (F,)   assigned uv count per face.
+        uv_ids          (C',)  uv ids of every face, face after face.
+    Derived arrays are built from the ones above with numpy only:
+        edge_face_counts (E,)  number of faces sharing every edge.
+        edge_lengths     (E,)  length of every edge.
+        vertex_valences  (V,)  number of edges connected to every vertex.
+        face_areas       (F,)  area of every face.
+        lamina_faces     (F,)  True for faces sharing their whole vertex set with another face.
+        uv_face_min      (F, 2) lowest u and v of every face, nan for faces without uvs.
+        uv_face_max      (F, 2) highest u and v of every face, nan for faces without uvs.
+        uv_face_areas    (F,)  signed uv area of every face, negative when flipped.
+        locked_normals   (C,)  True for every locked (frozen) face vertex normal, in face_connects order.
+    """
+    def __init__(self, dag_path=None):
+        self.dag_path = om2.MDagPath(dag_path)
+        if self.dag_path.apiType() == om2.MFn.kTransform:
+            self.dag_path.extendToShape()
+        self.name = self.dag_path.fullPathName()
+        self.fn = om2.MFnMesh(self.dag_path)
+        self._cache = {}
+
+    def _get(self, key, func):
+        if key not in self._cache:
+            self._cache[key] = func()
+        return self._cache[key]
+
+    @property
+    def num_vertices(self) -> int:
+        return self.fn.numVertices
+
+    @property
+    def num_faces(self) -> int:
+        return self.fn.numPolygons
+
+    @property
+    def num_edges(self) -> int:
+        return self.fn.numEdges
+
+    @property
+    def points(self):
+        return self._get('points', lambda: np.array(self.fn.getPoints(om2.MSpace.kObject), dtype=np.float64).reshape(-1, 4)[:, :3])
+
+    def _vertices(self):
+        counts, connects = self.fn.getVertices()
+        self._cache['face_counts'] = np.array(counts, dtype=np.int64)
+        self._cache['face_connects'] = np.array(connects, dtype=np.int64)
+
+    @property
+    def face_counts(self):
+        if 'face_counts' not in self._cache: self._vertices()
+        return self._cache['face_counts']
+
+    @property
+    def face_connects(self):
+        if 'face_connects' not in self._cache: self._vertices()
+        return self._cache['face_connects']
+
+    @property
+    def face_offsets(self):
+        return self._get('face_offsets', lambda: np.cumsum(self.face_counts) - self.face_counts)
+
+    @property
+    def face_ids(self):
+        return self._get('face_ids', lambda: np.repeat(np.arange(self.num_faces, dtype=np.int64), self.face_counts))
+
+    @property
+    def edge_vertices(self):
+        if 'edge_vertices' not in self._cache: self._edges()
+        return self._cache['edge_vertices']
+
+    @property
+    def smooth_edges(self):
+        if 'smooth_edges' not in self._cache: self._edges()
+        return self._cache['smooth_edges']
+
+    @property
+    def starlike_faces(self):
+        return self._get('starlike_faces', self._starlike_faces)
+
+    @property
+    def edge_face_counts(self):
+        if 'edge_face_counts' not in self._cache: self._edges()
+        return self._cache['edge_face_counts']
+
+    @property
+    def edge_lengths(self):
+        return self._get('edge_lengths', lambda: np.linalg.norm(self.points[self.edge_vertices[:, 1]] - self.points[self.edge_vertices[:, 0]], axis=1))
+
+    @property
+    def vertex_valences(self):
+        return self._get('vertex_valences', lambda: np.bincount(self.edge_vertices.ravel(), minlength=self.num_vertices))
+
+    @property
+    def face_areas(self):
+        return self._get('face_areas', self._face_areas)
+
+    @property
+    def lamina_faces(self):
+        return self._get('lamina_faces', self._lamina_faces)
+
+    @property
+    def following(self):
+        """
+        Index of the next corner inside the same face, for every face_connects entry.
+        """
+        def build():
+            following = np.arange(1, self.face_connects.size + 1)
+            following[self.face_offsets + self.face_counts - 1] = self.face_offsets
+            return following
+        return self._get('following', build)
+
+    def _face_areas(self):
+        """
+        Fan triangulate every face from its first vertex: corners touching the fan origin add a
+        null cross product, so summing the cross product norms per face gives the fan area.
+        Triangles facing opposite ways add up instead of cancelling, so bowtie or folded faces
+        keep their area.
+        """
+        if self.face_connects.size == 0: return np.zeros(self.num_faces)
+        points, connects = self.points, self.face_connects
+        origin = points[connects[self.face_offsets]][self.face_ids]
+        cross = np.cross(points[connects] - origin, points[connects[self.following]] - origin)
+        return 0.5 * np.bincount(self.face_ids, weights=np.linalg.norm(cross, axis=1), minlength=self.num_faces)
+
+    def _lamina_faces(self):
+        """
+        Sort every face vertex set, then group identical sets per face size with np.unique.
+        """
+        laminas = np.zeros(self.num_faces, dtype=bool)
+        if self.face_connects.size == 0: return laminas
+        order = np.lexsort((self.face_connects, self.face_ids))
+        sorted_connects = self.face_connects[order]
+        for count in np.unique(self.face_counts).tolist():
+            faces = np.flatnonzero(self.face_counts == count)
+            rows = sorted_connects[self.face_offsets[faces][:, None] + np.arange(count)]
+            _, inverse, counts = np.unique(rows, axis=0, return_inverse=True, return_counts=True)
+            laminas[faces] = counts[inverse.ravel()] > 1
+        return laminas
+
+    @property
+    def locked_normals(self):
+        return self._get('locked_normals', self._locked_normals)
+
+    def _locked_normals(self):
+        """
+        Lock state of every face vertex normal, read as one array with a single polyNormalPerVertex
+        query over vtxFace[*][*], which lists them vertex after vertex by increasing face id.
+        Return it in face_connects order.
+        """
+        locked = np.asarray(cmds.polyNormalPerVertex(f"{self.name}.vtxFace[*][*]", query=True, freezeNormal=True) or [], dtype=bool)
+        result = np.zeros(self.face_connects.size, dtype=bool)
+        if locked.size == result.size: result[np.lexsort((self.face_ids, self.face_connects))] = locked
+        return result
+
+    def has_locked_normals(self) -> bool:
+        return bool(self.locked_normals.any())
+
+    def locked_vertices(self):
+        """
+        Return the vertex ids holding at least one locked normal.
+        """
+        return np.unique(self.face_connects[self.locked_normals])
+
+    @property
+    def uv_offsets(self):
+        return self._get('uv_offsets', lambda: np.cumsum(self.uv_counts) - self.uv_counts)
+
+    @property
+    def uv_face_ids(self):
+        return self._get('uv_face_ids', lambda: np.repeat(np.arange(self.uv_counts.size, dtype=np.int64), self.uv_counts))
+
+    @property
+    def uv_following(self):
+        """
+        Index of the next uv corner inside the same face, for every uv_ids entry.
+        """
+        def build():
+            following = np.arange(1, self.uv_ids.size + 1)
+            has_uvs = self.uv_counts > 0
+            following[(self.uv_offsets + self.uv_counts - 1)[has_uvs]] = self.uv_offsets[has_uvs]
+            return following
+        return self._get('uv_following', build)
+
+    @property
+    def uv_face_min(self):
+        if 'uv_face_min' not in self._cache: self._uv_bounds()
+        return self._cache['uv_face_min']
+
+    @property
+    def uv_face_max(self):
+        if 'uv_face_max' not in self._cache: self._uv_bounds()
+        return self._cache['uv_face_max']
+
+    @property
+    def uv_face_areas(self):
+        return self._get('uv_face_areas', self._uv_face_areas)
+
+    def _uv_bounds(self):
+        mins = np.full((self.uv_counts.size, 2), np.nan)
+        maxs = np.full((self.uv_counts.size, 2), np.nan)
+        has_uvs = self.uv_counts > 0
+        if self.uv_ids.size:
+            corners = self.uvs[self.uv_ids]
+            mins[has_uvs] = np.minimum.reduceat(corners, self.uv_offsets[has_uvs], axis=0)
+            maxs[has_uvs] = np.maximum.reduceat(corners, self.uv_offsets[has_uvs], axis=0)
+        self._cache['uv_face_min'] = mins
+        self._cache['uv_face_max'] = maxs
+
+    def _uv_face_areas(self):
+        """
+        Shoelace formula over every uv corner of a face, so the whole polygon drives its winding.
+        """
+        if self.uv_ids.size == 0: return np.zeros(self.uv_counts.size)
+        current, following = self.uvs[self.uv_ids], self.uvs[self.uv_ids[self.uv_following]]
+        terms = current[:, 0] * following[:, 1] - following[:, 0] * current[:, 1]
+        return 0.5 * np.bincount(self.uv_face_ids, weights=terms, minlength=self.uv_counts.size)
+
+    def _edges(self):
+        """
+        Derive every edge from the face sides: sides are keyed by their sorted vertex pair and
+        deduplicated with np.unique, which also counts the faces around each edge. Maya edge ids
+        and smoothing come from one bulk read of the mesh edge table, matched back by key.
+        """
+        connects = self.face_connects
+        sides = np.column_stack((connects, connects[self.following]))
+        keys, first, counts = np.unique(edge_keys(sides, self.num_vertices), return_index=True, return_counts=True)
+        table = self._edge_table()
+        vertices, face_counts = table[:, :2].copy(), np.zeros(len(table), dtype=np.int64)
+        if keys.size:
+            maya_keys = edge_keys(table[:, :2], self.num_vertices)
+            index = np.clip(np.searchsorted(keys, maya_keys), 0, keys.size - 1)
+            found = keys[index] == maya_keys
+            vertices[found] = sides[first[index[found]]]
+            face_counts[found] = counts[index[found]]
+        self._cache['edge_vertices'] = vertices
+        self._cache['edge_face_counts'] = face_counts
+        self._cache['smooth_edges'] = table[:, 2] != 0
+
+    def _edge_table(self):
+        """
+        Return the (E, 3) vertex ids and smooth flag of every edge, in maya edge order, read from
+        the mesh edge attribute with a single getAttr instead of one MItMeshEdge step per edge.
+        """
+        if not self.num_edges: return np.zeros((0, 3), dtype=np.int64)
+        table = cmds.getAttr(f"{self.name}.edge[0:{self.num_edges - 1}]")
+        return np.array(table, dtype=np.int64).reshape(-1, 3)
+
+    def _starlike_faces(self):
+        starlike = np.ones(self.num_faces, dtype=bool)
+        iterator = om2.MItMeshPolygon(self.dag_path)
+        while not iterator.isDone():
+            starlike[iterator.index()] = iterator.isStarlike()
+            iterator.next()
+        return starlike
+
+    def _uvs(self):
+        try:
+            u, v = self.fn.getUVs()
+            counts, ids = self.fn.getAssignedUVs()
+        except:
+            u, v, counts, ids = [], [], [0] * self.num_faces, []
+        self._cache['uvs'] = np.column_stack((np.array(u, dtype=np.float64), np.array(v, dtype=np.float64))).reshape(-1, 2)
+        self._cache['uv_counts'] = np.array(counts, dtype=np.int64)
+        self._cache['uv_ids'] = np.array(ids, dtype=np.int64)
+
+    @property
+    def uvs(self):
+        if 'uvs' not in self._cache: self._uvs()
+        return self._cache['uvs']
+
+    @property
+    def uv_counts(self):
+        if 'uv_counts' not in self._cache: self._uvs()
+        return self._cache['uv_counts']
+
+    @property
+    def uv_ids(self):
+        if 'uv_ids' not in self._cache: self._uvs()
+        return self._cache['uv_ids']
+
+
+def edge_keys(pairs=None, num_vertices=0):
+    """
+    Key vertex pairs independently of their order, so an edge and its reverse share one key.
+    """
+    return np.minimum(pairs[:, 0], pairs[:, 1]) * max(num_vertices, 1) + np.maximum(pairs[:, 0], pairs[:, 1])
+
+
+def component_ranges(path=None, component='f', indices=None) -> list:
+    """
+    Encode component indices as maya range strings. ex: [0, 1, 2, 5] -> ['path.f[0:2]', 'path.f[5]'].
+    """
+    indices = np.unique(np.asarray(indices, dtype=np.int64))
+    if indices.size == 0: return []
+    breaks = np.flatnonzero(np.diff(indices) != 1) + 1
+    starts = indices[np.concatenate(([0], breaks))]
+    ends = indices[np.concatenate((breaks - 1, [indices.size - 1]))]
+    return [f"{path}.{component}[{start}]" if start == end else f"{path}.{component}[{start}:{end}]" for start, end in zip(starts.tolist(), ends.tolist())]
+
+
+def read_tweaks(shape=None):
+    """
+    Read every tweak (pnts) value of a mesh shape with a single getAttr, as a (T, 3) array.
+    """
+    try: values = cmds.getAttr(f"{shape}.pnts[*]")
+    except: values = None
+    return np.array(values or [], dtype=np.float64).reshape(-1, 3)
+
+
+def has_tweaks(shape=None, tolerance=TWEAK_TOLERANCE) -> bool:
+    return bool(np.any(np.abs(read_tweaks(shape)) > tolerance))
+
+
+def bake_tweaks(shape=None, tolerance=TWEAK_TOLERANCE) -> bool:
+    """
+    Bake the tweaks of a history free mesh shape into its vertices with an undoable polyMoveVertex.
+    Meshs with construction history are left untouched, baking them would need their history,
+    deformers included, deleted. Return False when tweaks remain on the shape.
+    """
+    if not has_tweaks(shape, tolerance): return True
+    if cmds.listConnections(f"{shape}.inMesh", source=True, destination=False): return False
+    cmds.polyMoveVertex(shape, constructionHistory=False)
+    return not has_tweaks(shape, tolerance)
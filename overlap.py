@@ -0,0 +1,162 @@
+"""
+CHECKER. (c)
+
+Author:  Gregoire Dehame
+Created: Oct 18, 2026
+Module:  checker.overlap
+Purpose: uv overlap engine running on extracted mesh arrays, replacing polyUVOverlap.
+Execute: from checker import overlap; overlap.overlapping_faces([(mesh_data, None)])
+"""
+
+try:
+    import numpy as np
+except: pass
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+TOLERANCE = 0.0000001
+MAX_PAIRS = 65536
+MAX_STRIPS = 4096
+
+
+def uv_triangles(data=None, faces=None):
+    """
+    Fan triangulate the uv polygons of a meshdata.MeshData.
+    Return the (T, 3, 2) triangles uv positions and the (T,) face id owning each triangle.
+    faces can restrict the triangulation to some face ids.
+    """
+    if data.uv_ids.size == 0: return np.zeros((0, 3, 2)), np.zeros(0, dtype=np.int64)
+    corner_faces = data.uv_face_ids
+    offsets = data.uv_offsets[corner_faces]
+    position = np.arange(data.uv_ids.size) - offsets
+    keep = (position >= 1) & (position <= data.uv_counts[corner_faces] - 2)
+    if faces is not None:
+        mask = np.zeros(data.uv_counts.size, dtype=bool)
+        mask[np.asarray(faces, dtype=np.int64)] = True
+        keep &= mask[corner_faces]
+    corners = np.flatnonzero(keep)
+    ids = np.column_stack((data.uv_ids[offsets[corners]], data.uv_ids[corners], data.uv_ids[corners + 1]))
+    return data.uvs[ids], corner_faces[corners]
+
+
+def sweep_entries(boxes_min=None, boxes_max=None, axis=0):
+    """
+    Sort and sweep broad phase setup. Boxes are binned into strips along the other axis, a box
+    spanning at most MAX_STRIPS strips, then sorted along axis inside each strip. Return the
+    sorted entries box ids and strips, the end of the entries of the same strip starting before
+    each entry ends, and the strip size and origin. Boxes only touching are not candidates.
+    """
+    other = 1 - axis
+    origin = boxes_min.min(axis=0)
+    span = boxes_max.max(axis=0) - origin
+    size = max(float(np.mean(boxes_max[:, other] - boxes_min[:, other])), float(span[other]) / MAX_STRIPS, TOLERANCE)
+    low = ((boxes_min[:, other] - origin[other]) // size).astype(np.int64)
+    counts = ((boxes_max[:, other] - origin[other]) // size).astype(np.int64) - low + 1
+    boxes = np.repeat(np.arange(len(boxes_min)), counts)
+    strips = low[boxes] + np.arange(boxes.size) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    width = float(span[axis]) + 1.0
+    keys = strips * width + (boxes_min[boxes, axis] - origin[axis])
+    order = np.argsort(keys, kind='stable')
+    boxes, strips, keys = boxes[order], strips[order], keys[order]
+    ends = np.searchsorted(keys, strips * width + (boxes_max[boxes, axis] - origin[axis]) - TOLERANCE, side='left')
+    ends = np.maximum(ends, np.arange(boxes.size) + 1)
+    return boxes, strips, ends, size, origin[other]
+
+
+def overlapping_triangles(triangles=None, owners=None, faces=None):
+    """
+    Sort and sweep narrow phase over (T, 3, 2) uv triangles, along the uv axis giving the fewest
+    candidates, in batches of at most MAX_PAIRS candidate pairs. A pair is only generated in the
+    strip holding the highest of both lower bounds, so each pair is tested once. A triangle
+    already found overlapping is only tested against triangles not found yet, so stacked shells
+    cost one pass instead of every pair. Return the (T,) overlapping mask.
+    """
+    count = len(triangles)
+    hit = np.zeros(count, dtype=bool)
+    if count < 2: return hit
+    boxes_min, boxes_max = triangles.min(axis=1), triangles.max(axis=1)
+    sweeps = [(axis,) + sweep_entries(boxes_min, boxes_max, axis) for axis in (0, 1)]
+    axis, boxes, strips, ends, size, origin = min(sweeps, key=lambda sweep: int(np.sum(sweep[3] - np.arange(sweep[3].size))))
+    other = 1 - axis
+    positions = np.arange(boxes.size)
+
+    start, changed = 0, True
+    while start < boxes.size:
+        if changed: sorted_hit = hit[boxes]; unhit = np.flatnonzero(~sorted_hit)
+        window = positions[start:start + MAX_PAIRS]
+        first_unhit = np.searchsorted(unhit, window, side='right')
+        last_unhit = np.searchsorted(unhit, ends[window], side='left')
+        sizes = np.where(sorted_hit[window], last_unhit - first_unhit, ends[window] - window - 1)
+        stop = max(int(np.searchsorted(np.cumsum(sizes), MAX_PAIRS, side='right')), 1)
+        batch, sizes, first_unhit = window[:stop], sizes[:stop], first_unhit[:stop]
+        start, changed = start + stop, False
+        if not sizes.any(): continue
+
+        local = np.arange(int(sizes.sum())) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        first = np.repeat(batch, sizes)
+        second = first + local + 1
+        from_hit = np.repeat(sorted_hit[batch], sizes)
+        if from_hit.any(): second[from_hit] = unhit[np.repeat(first_unhit, sizes)[from_hit] + local[from_hit]]
+        strip, first, second = strips[first], boxes[first], boxes[second]
+
+        # interval test on the other axis, and triangles of the same polygon share edges by construction.
+        lowest = np.maximum(boxes_min[first, other], boxes_min[second, other])
+        keep = (np.minimum(boxes_max[first, other], boxes_max[second, other]) - lowest) > TOLERANCE
+        keep &= ((lowest - origin) // size).astype(np.int64) == strip
+        keep &= (owners[first] != owners[second]) | (faces[first] != faces[second])
+        first, second = first[keep], second[keep]
+        overlap = triangles_overlap(triangles[first], triangles[second])
+        changed = bool(overlap.any())
+        hit[first[overlap]] = True
+        hit[second[overlap]] = True
+    return hit
+
+
+def triangles_overlap(a=None, b=None):
+    """
+    Exact separating axis test between (P, 3, 2) triangle pairs. Triangles only touching along
+    an edge or a corner are not overlapping.
+    """
+    overlap = np.ones(len(a), dtype=bool)
+    for triangles in (a, b):
+        for i in range(3):
+            edge = triangles[:, (i + 1) % 3] - triangles[:, i]
+            axis = np.column_stack((-edge[:, 1], edge[:, 0]))
+            projection_a = np.einsum('pkc,pc->pk', a, axis)
+            projection_b = np.einsum('pkc,pc->pk', b, axis)
+            depth = np.minimum(projection_a.max(axis=1), projection_b.max(axis=1)) - np.maximum(projection_a.min(axis=1), projection_b.min(axis=1))
+            overlap &= depth > TOLERANCE * np.linalg.norm(axis, axis=1)
+    return overlap
+
+
+def overlapping_faces(items=None) -> dict:
+    """
+    Find overlapping uv faces between every given mesh.
+        items: list of (meshdata.MeshData, face ids or None for every face).
+    Return {mesh name: sorted overlapping face ids}.
+    """
+    triangles, owners, faces = [], [], []
+    for i, (data, face_ids) in enumerate(items):
+        mesh_triangles, mesh_faces = uv_triangles(data, face_ids)
+        triangles.append(mesh_triangles)
+        owners.append(np.full(len(mesh_faces), i, dtype=np.int64))
+        faces.append(mesh_faces)
+    if not triangles: return {}
+    triangles, owners, faces = np.concatenate(triangles), np.concatenate(owners), np.concatenate(faces)
+
+    # degenerate triangles can not overlap anything, a collapsed uv layout has nothing to test.
+    edges_a, edges_b = triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+    valid = np.abs(edges_a[:, 0] * edges_b[:, 1] - edges_a[:, 1] * edges_b[:, 0]) * 0.5 > TOLERANCE * TOLERANCE
+    if not valid.any(): return {}
+    triangles, owners, faces = triangles[valid], owners[valid], faces[valid]
+
+    result = {}
+    hits = np.flatnonzero(overlapping_triangles(triangles, owners, faces))
+    for i, (data, face_ids) in enumerate(items):
+        mesh_faces = np.unique(faces[hits[owners[hits] == i]])
+        if mesh_faces.size:
+            result[data.name] = np.union1d(result.get(data.name, []), mesh_faces).astype(np.int64)
+    return result
@@ -10,8 +10,20 @@ Execute: from checker import printter; printter.FUNCTION()
 
 from PySide2 import QtCore, QtGui, QtWidgets
 import inspect
+import itertools
+
+try:
+    import numpy as np
+except: pass
+
+from . import components, results
 
 GREY = QtGui.QColor(43, 43, 43)
+SUCCESS = 'SUCCESS'
+ERROR = 'ERROR'
+STATUS_COLORS = {SUCCESS: QtGui.QColor(86, 214, 86), ERROR: QtGui.QColor(214, 86, 86), None: QtGui.QColor(206, 145, 120)}
+BATCH_SIZE = 1000
+FILTER_DELAY = 150
 
 class LineNumberArea(QtWidgets.QWidget):
     def __init__(self, editor):
@@ -244,4 +256,217 @@ class Editor(PrintTextEdit):
             selection.cursor = self.textCursor()
             selection.cursor.clearSelection()
             extra_selections.append(selection)
-        self.setExtraSelections(extra_selections)
\ No newline at end of file
+        self.setExtraSelections(extra_selections)
+
+
+class ReportItem(object):
+    """
+    Row of the report model, holding the index rows of the results it stands for, as an array.
+    Children are not built until the row is expanded: pending holds a generator of the rows
+    left to add, consumed BATCH_SIZE rows at a time.
+    """
+    __slots__ = ['parent', 'row', 'text', 'status', 'check', 'mesh', 'rows', 'children', 'pending']
+
+    def __init__(self, parent=None, text='', status=None, check=None, mesh=None, rows=None, pending=None):
+        self.parent = parent
+        self.row = len(parent.children) if parent is not None else 0
+        self.text = text
+        self.status = status
+        self.check = check
+        self.mesh = mesh
+        self.rows = rows
+        self.children = []
+        self.pending = pending
+
+
+class ReportModel(QtCore.QAbstractItemModel):
+    """
+    Report grouped by check, then mesh, then components, backed by a results.ResultIndex.
+    Every row only keeps the index rows it stands for: checks, meshs and component ranges are
+    generated from them when their parent is fetched, so a view only pays for the rows it
+    shows, and filtering only swaps the index rows of the top level.
+    """
+    def __init__(self, parent=None):
+        super(ReportModel, self).__init__(parent)
+        self.root = ReportItem()
+        self.report_index = results.ResultIndex()
+        self.query = {}
+        self.show_nodes = True
+
+    def item(self, index=None):
+        return index.internalPointer() if index.isValid() else self.root
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        item = self.item(parent)
+        if column != 0 or row < 0 or row >= len(item.children): return QtCore.QModelIndex()
+        return self.createIndex(row, column, item.children[row])
+
+    def parent(self, index=QtCore.QModelIndex()):
+        if not index.isValid(): return QtCore.QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self.root: return QtCore.QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return len(self.item(parent).children)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        item = self.item(parent)
+        return item is self.root or bool(item.children) or item.pending is not None
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        return self.item(parent).pending is not None
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        item = self.item(parent)
+        if item.pending is None: return
+        rows = list(itertools.islice(item.pending, BATCH_SIZE))
+        if len(rows) < BATCH_SIZE: item.pending = None
+        if not rows: return
+        self.beginInsertRows(parent, len(item.children), len(item.children) + len(rows) - 1)
+        for text, status, check, mesh, index_rows, pending in rows:
+            item.children.append(ReportItem(item, text, status, check, mesh, index_rows, pending))
+        self.endInsertRows()
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid(): return None
+        item = index.internalPointer()
+        if role == QtCore.Qt.DisplayRole: return item.text
+        if role == QtCore.Qt.ForegroundRole: return QtGui.QBrush(STATUS_COLORS[item.status])
+        return None
+
+    def add_check(self, check=None, title=None, text='', status=SUCCESS, errors=None):
+        """
+        Index a check run and append its row when it matches the current filter.
+        """
+        rows = self.report_index.add(check, title, status, errors, label=text)
+        if self.query: rows = np.intersect1d(rows, self.report_index.filter(**self.query))
+        if not rows.size: return
+        if self.root.pending is not None:
+            self.root.pending = itertools.chain(self.root.pending, [self.check_row(len(self.report_index.checks) - 1, rows)])
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), len(self.root.children), len(self.root.children))
+        self.root.children.append(ReportItem(self.root, *self.check_row(len(self.report_index.checks) - 1, rows)))
+        self.endInsertRows()
+
+    def check_row(self, check=None, rows=None) -> tuple:
+        method, title, status, label = self.report_index.checks[check]
+        has_entries = bool((self.report_index.column('mesh')[rows] >= 0).any())
+        return label, status, method, None, rows, self.mesh_rows(method, rows) if has_entries and self.show_nodes else None
+
+    def check_rows(self, rows=None):
+        codes, starts = np.unique(self.report_index.column('check')[rows], return_index=True)
+        for check, check_rows in zip(codes.tolist(), np.split(rows, starts[1:])):
+            yield self.check_row(check, check_rows)
+
+    def mesh_rows(self, check=None, rows=None):
+        """
+        Group the index rows of a check per mesh, sorting their mesh codes once.
+        """
+        codes = self.report_index.column('mesh')[rows]
+        rows, codes = rows[codes >= 0], codes[codes >= 0]
+        order = np.argsort(codes, kind='stable')
+        rows, codes = rows[order], codes[order]
+        meshs, starts = np.unique(codes, return_index=True)
+        for code, mesh_rows in zip(meshs.tolist(), np.split(rows, starts[1:])):
+            mesh = self.report_index.name('mesh', code)
+            entries = self.report_index.results(mesh_rows)
+            if len(entries) == 1 and not isinstance(entries[0], components.Components) and str(entries[0]) == mesh:
+                yield f" - '{mesh}'", None, check, mesh, mesh_rows, None
+            else:
+                yield f" - '{mesh}' ({components.count(entries)})", None, check, mesh, mesh_rows, self.component_rows(check, mesh, mesh_rows)
+
+    def component_rows(self, check=None, mesh=None, rows=None):
+        for entry in components.expand(self.report_index.results(rows)):
+            yield f"    - '{entry}'", None, check, mesh, rows, None
+
+    def set_filter(self, check='', mesh='', component=None, status=None):
+        """
+        Show only the results matching every given criteria, see results.ResultIndex.filter.
+        Check rows are generated from the matching index rows as the view fetches them.
+        """
+        self.query = {key: value for key, value in (('check', check), ('mesh', mesh)) if value}
+        self.query.update({key: value for key, value in (('component', component), ('status', status)) if value is not None})
+        self.beginResetModel()
+        self.root = ReportItem(pending=self.check_rows(self.report_index.filter(**self.query)))
+        self.endResetModel()
+
+    def set_show_nodes(self, state=True):
+        """
+        Show or hide the mesh and component rows under every check, keeping the current filter.
+        """
+        self.show_nodes = state
+        self.set_filter(**self.query)
+
+    def filtered_results(self, method=None) -> list:
+        """
+        Return the results of the last run of a check matching the current filter.
+        """
+        check = self.report_index.latest(method)
+        if check is None: return []
+        rows = self.report_index.filter(**self.query)
+        return self.report_index.results(rows[self.report_index.column('check')[rows] == check])
+
+    def clear(self):
+        self.beginResetModel()
+        self.root = ReportItem()
+        self.report_index.clear()
+        self.endResetModel()
+
+
+class ReportView(QtWidgets.QTreeView):
+    """
+    Virtualized report view: uniform row heights let the view lay out and paint only the
+    visible rows, and every group is collapsed until expanded.
+    """
+    def __init__(self):
+        super(ReportView, self).__init__()
+        self.font = QtGui.QFont()
+        self.font.setFamily("Consolas")
+        self.font.setStyleHint(QtGui.QFont.Monospace)
+        self.font.setPointSize(9)
+        self.setFont(self.font)
+        self.setHeaderHidden(True)
+        self.setUniformRowHeights(True)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.setModel(ReportModel(self))
+
+
+class ReportFilter(QtWidgets.QWidget):
+    """
+    Filter bar of a ReportModel, by check name, mesh path, component type and status.
+    Text edits are applied once typing pauses for FILTER_DELAY milliseconds.
+    """
+    COMPONENTS = [('All Components', None), ('Nodes', ''), ('Faces', 'f'), ('Edges', 'e'), ('Vertices', 'vtx')]
+    STATUS = [('All Status', None), ('Error', ERROR), ('Success', SUCCESS)]
+
+    def __init__(self, model=None):
+        super(ReportFilter, self).__init__()
+        self.model = model
+        self.layout = QtWidgets.QHBoxLayout(self)
+        self.layout.setContentsMargins(0,0,0,0)
+        self.check = QtWidgets.QLineEdit()
+        self.check.setPlaceholderText("Check")
+        self.mesh = QtWidgets.QLineEdit()
+        self.mesh.setPlaceholderText("Mesh")
+        self.component = QtWidgets.QComboBox()
+        [self.component.addItem(label, value) for label, value in self.COMPONENTS]
+        self.status = QtWidgets.QComboBox()
+        [self.status.addItem(label, value) for label, value in self.STATUS]
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(FILTER_DELAY)
+        self.timer.timeout.connect(self.apply)
+        for line_edit in [self.check, self.mesh]:
+            line_edit.setClearButtonEnabled(True)
+            line_edit.textChanged.connect(lambda *args: self.timer.start())
+            self.layout.addWidget(line_edit)
+        for combo_box in [self.component, self.status]:
+            combo_box.currentIndexChanged.connect(self.apply)
+            self.layout.addWidget(combo_box)
+
+    def apply(self, *args):
+        self.model.set_filter(check=self.check.text(), mesh=self.mesh.text(), component=self.component.currentData(), status=self.status.currentData())
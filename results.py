@@ -0,0 +1,205 @@
+"""
+CHECKER. (c)
+
+Author:  Gregoire Dehame
+Created: Oct 18, 2026
+Module:  checker.results
+Purpose: in memory check results store and report index, selected in bulk through a single MSelectionList.
+Execute: from checker import results; results.ResultStore()
+"""
+
+try:
+    import maya.api.OpenMaya as om2
+except: pass
+try:
+    import numpy as np
+except: pass
+
+import re
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+from . import components
+
+COMPONENT_TYPES = {'f': 'kMeshPolygonComponent', 'e': 'kMeshEdgeComponent', 'vtx': 'kMeshVertComponent'}
+
+
+def check_name(method=None) -> str:
+    """
+    Key run and fix methods of the same check together. ex: 'ngons_fix' -> 'ngons_get'.
+    """
+    return f"{method[:-4]}_get" if method.endswith('_fix') else method
+
+
+def entry_mesh(entry=None) -> str:
+    """
+    Return the mesh or node a result belongs to. ex: 'pCube1.f[2]' -> 'pCube1'.
+    """
+    if isinstance(entry, components.Components): return entry.path
+    return str(entry).split('.')[0]
+
+
+def entry_component(entry=None) -> str:
+    """
+    Return the component type of a result, or an empty string for nodes. ex: 'pCube1.f[2]' -> 'f'.
+    """
+    if isinstance(entry, components.Components): return entry.component
+    return str(entry).partition('.')[2].split('[')[0]
+
+
+def selection_list(entries=None):
+    """
+    Build a single MSelectionList from check results. Components are added as indexed
+    components of their mesh, one MFnSingleIndexedComponent per mesh, without any string
+    parsing. Return the selection list and the entries that do not exist anymore.
+    """
+    selection, missing = om2.MSelectionList(), []
+    for entry in entries:
+        if isinstance(entry, components.Components):
+            try: dag_path = om2.MGlobal.getSelectionListByName(entry.path).getDagPath(0)
+            except: missing.append(entry.path); continue
+            fn = om2.MFnSingleIndexedComponent()
+            component = fn.create(getattr(om2.MFn, COMPONENT_TYPES[entry.component]))
+            fn.addElements(entry.indices.tolist())
+            selection.add((dag_path, component))
+        else:
+            try: selection.add(entry)
+            except: missing.append(entry)
+    return selection, missing
+
+
+def select(entries=None) -> list:
+    """
+    Replace the active selection with the given results, in a single call.
+    Return the entries that could not be selected.
+    """
+    selection, missing = selection_list(entries)
+    om2.MGlobal.setActiveSelectionList(selection)
+    return missing
+
+
+class ResultIndex(object):
+    """
+    Report entries indexed for filtering, one row per result, with the check run, mesh, component
+    type and status of every row stored as integer codes in numpy arrays. Text queries search the
+    distinct names joined in a single string, then select rows with a single np.isin over the codes.
+    Checks without errors get a single row whose entry is None, with no mesh nor component, so
+    they can still be filtered by check and status.
+    """
+    FIELDS = ['check', 'mesh', 'component', 'status']
+
+    def __init__(self):
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def clear(self):
+        self.entries = []
+        self.checks = []
+        self._names = {field: [] for field in self.FIELDS}
+        self._codes = {field: {} for field in self.FIELDS}
+        self._columns = {field: [] for field in self.FIELDS}
+        self._arrays = {}
+        self._matches = {}
+        self._joined = {}
+
+    def code(self, field=None, name=None) -> int:
+        codes = self._codes[field]
+        if name not in codes:
+            codes[name] = len(self._names[field])
+            self._names[field].append(name)
+        return codes[name]
+
+    def name(self, field=None, code=None) -> str:
+        return self._names[field][code]
+
+    def column(self, field=None):
+        if field not in self._arrays:
+            self._arrays[field] = np.array(self._columns[field], dtype=np.int64)
+        return self._arrays[field]
+
+    def add(self, method=None, title=None, status=None, errors=None, label=None):
+        """
+        Index a check run and its results, label being the report line of the run.
+        Return the rows added.
+        """
+        check = len(self.checks)
+        self.checks.append((check_name(method), title, status, label or f"[ {status} ] {title}"))
+        self._names['check'].append(f"{title} {method}".lower())
+        start, status = len(self.entries), self.code('status', status)
+        for entry in errors or [None]:
+            self.entries.append(entry)
+            self._columns['check'].append(check)
+            self._columns['mesh'].append(-1 if entry is None else self.code('mesh', entry_mesh(entry)))
+            self._columns['component'].append(-1 if entry is None else self.code('component', entry_component(entry)))
+            self._columns['status'].append(status)
+        self._arrays, self._matches, self._joined = {}, {}, {}
+        return np.arange(start, len(self.entries))
+
+    def matching(self, field=None, text=None):
+        """
+        Return the codes of every name of field containing text, case insensitive.
+        """
+        key = (field, text.lower())
+        if key not in self._matches:
+            if field not in self._joined:
+                names = [name.lower() for name in self._names[field]]
+                offsets = np.cumsum([0] + [len(name) + 1 for name in names[:-1]], dtype=np.int64)
+                self._joined[field] = ('\n'.join(names), offsets)
+            joined, offsets = self._joined[field]
+            starts = np.fromiter((match.start() for match in re.finditer(re.escape(key[1]), joined)), dtype=np.int64)
+            self._matches[key] = np.unique(np.searchsorted(offsets, starts, side='right') - 1)
+        return self._matches[key]
+
+    def filter(self, check='', mesh='', component=None, status=None):
+        """
+        Return the rows matching every given criteria. check and mesh match by substring,
+        component and status exactly.
+        """
+        mask = np.ones(len(self.entries), dtype=bool)
+        for field, text in (('check', check), ('mesh', mesh)):
+            if text: mask &= np.isin(self.column(field), self.matching(field, text))
+        for field, name in (('component', component), ('status', status)):
+            if name is not None: mask &= self.column(field) == self._codes[field].get(name, -1)
+        return np.flatnonzero(mask)
+
+    def latest(self, method=None):
+        """
+        Return the code of the last indexed run of the given check, or None.
+        """
+        for check in range(len(self.checks) - 1, -1, -1):
+            if self.checks[check][0] == check_name(method): return check
+        return None
+
+    def results(self, rows=None) -> list:
+        return [self.entries[row] for row in rows.tolist() if self.entries[row] is not None]
+
+
+class ResultStore(object):
+    """
+    Last results of every check, keyed by check name, kept as returned by the checks.
+    """
+    def __init__(self):
+        self._results = {}
+
+    def __contains__(self, method=None) -> bool:
+        return check_name(method) in self._results
+
+    def store(self, method=None, errors=None):
+        if errors: self._results[check_name(method)] = list(errors)
+        else:      self._results.pop(check_name(method), None)
+
+    def get(self, method=None) -> list:
+        return self._results.get(check_name(method), [])
+
+    def clear(self):
+        self._results.clear()
+
+    def select(self, methods=None) -> list:
+        """
+        Replace the active selection with the results of the given checks, in a single call.
+        Return the entries that could not be selected.
+        """
+        return select([entry for method in methods for entry in self.get(method)])
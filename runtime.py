@@ -0,0 +1,137 @@
+"""
+CHECKER. (c)
+
+Author:  Gregoire Dehame
+Created: Oct 18, 2026
+Module:  checker.runtime
+Purpose: run-scoped scene query cache shared by every check of a single run.
+Execute: from checker import runtime; runtime.RunContext()
+"""
+
+try:
+    import maya.cmds as cmds
+    import maya.api.OpenMaya as om2
+except: pass
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+from . import utils, scope, meshdata, hierarchy, graph, transforms, shading, census
+
+class RunContext(object):
+    """
+    Memoize the scene queries every check repeats during a run: collected meshs and
+    transforms per method, their MDagPaths, shapes, node types, extracted mesh and transform arrays, shading
+    assignments, the
+    scene hierarchy index, the dependency graph snapshot and the node census.
+    It is created once by the interface for a run, handed to every check class, and
+    must be invalidated as soon as a fix touched the scene.
+    """
+    def __init__(self):
+        self._scopes = {}
+        self._dag_paths = {}
+        self._shapes = {}
+        self._node_types = {}
+        self._mesh_data = {}
+        self._transform_data = {}
+        self._shading_index = {}
+        self._hierarchy = None
+        self._graph = None
+        self._census = None
+
+    def invalidate(self):
+        """
+        Drop every cached query. Called after any fix so the next check never reads stale data.
+        """
+        for cache in [self._scopes, self._dag_paths, self._shapes, self._node_types, self._mesh_data, self._transform_data, self._shading_index]:
+            cache.clear()
+        self._hierarchy = None
+        self._graph = None
+        self._census = None
+
+    def resolve(self, method='scene'):
+        """
+        Resolve the method scope once, and seed the MDagPaths found during the traversal.
+        The topnode scope reads its subtree from the hierarchy index.
+        """
+        if method not in self._scopes:
+            self._scopes[method] = scope.resolve(method, hierarchy=self.hierarchy() if scope.split_method(method)[0] == 'topnode' else None)
+            self._dag_paths.update(self._scopes[method].dag_paths)
+        return self._scopes[method]
+
+    def mesh_array(self, method='scene') -> list:
+        return list(self.resolve(method).meshs)
+
+    def transform_array(self, method='scene') -> list:
+        return list(self.resolve(method).transforms)
+
+    def dag_path(self, node=None):
+        """
+        Return a copy of the node MDagPath, as callers are free to extend it to its shape.
+        """
+        if node not in self._dag_paths:
+            self._dag_paths[node] = om2.MGlobal.getSelectionListByName(node).getDagPath(0)
+        return om2.MDagPath(self._dag_paths[node])
+
+    def shapes(self, node=None) -> list:
+        if node not in self._shapes:
+            self._shapes[node] = utils.noneAsList(cmds.listRelatives(node, shapes=True, fullPath=True))
+        return list(self._shapes[node])
+
+    def node_type(self, node=None) -> str:
+        if node not in self._node_types:
+            self._node_types[node] = cmds.nodeType(node)
+        return self._node_types[node]
+
+    def mesh_data(self, node=None):
+        """
+        Return the node meshdata.MeshData, extracted once per mesh for the whole run.
+        """
+        if node not in self._mesh_data:
+            self._mesh_data[node] = meshdata.MeshData(self.dag_path(node))
+        return self._mesh_data[node]
+
+    def transform_data(self, method='scene'):
+        """
+        Return the transforms.TransformData of every mesh and transform of the method, read once per run.
+        """
+        if method not in self._transform_data:
+            nodes = self.mesh_array(method) + self.transform_array(method)
+            self._transform_data[method] = transforms.TransformData(nodes, [self.dag_path(node) for node in nodes])
+        return self._transform_data[method]
+
+    def shading_index(self, method='scene'):
+        """
+        Return the shading.ShadingIndex of every mesh of the method, read once per run.
+        """
+        if method not in self._shading_index:
+            self._shading_index[method] = shading.ShadingIndex([(node, self.mesh_data(node)) for node in self.mesh_array(method)])
+        return self._shading_index[method]
+
+    def full_path(self, node=None) -> str:
+        return self.dag_path(node).fullPathName()
+
+    def hierarchy(self):
+        """
+        Return the hierarchy.Hierarchy index of the scene, built in a single traversal per run.
+        """
+        if self._hierarchy is None:
+            self._hierarchy = hierarchy.Hierarchy()
+        return self._hierarchy
+
+    def graph(self):
+        """
+        Return the graph.Graph connections snapshot of the scene, taken once per run.
+        """
+        if self._graph is None:
+            self._graph = graph.Graph()
+        return self._graph
+
+    def census(self):
+        """
+        Return the census.Census of every node of the scene, listed once per run.
+        """
+        if self._census is None:
+            self._census = census.Census()
+        return self._census
@@ -0,0 +1,144 @@
+"""
+CHECKER. (c)
+
+Author:  Gregoire Dehame
+Created: Oct 18, 2026
+Module:  checker.scope
+Purpose: single pass MItDag scope resolver collecting meshs and plain transforms.
+Execute: from checker import scope; scope.resolve('scene')
+"""
+
+try:
+    import maya.cmds as cmds
+    import maya.api.OpenMaya as om2
+except: pass
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+from . import utils
+
+MESH = 'mesh'
+TRANSFORM = 'transform'
+SCOPES = ['scene', 'selection', 'topnode', 'set', 'namespace', 'layer']
+
+
+class Scope(object):
+    """
+    Result of a scope resolution: meshs and plain transforms partial names, with their MDagPaths.
+    """
+    def __init__(self, method='scene'):
+        self.method = method
+        self.meshs = []
+        self.transforms = []
+        self.dag_paths = {}
+
+    def add(self, path=None):
+        kind = classify(path)
+        if kind is None: return
+        name = path.partialPathName()
+        if name in self.dag_paths: return
+        self.dag_paths[name] = om2.MDagPath(path)
+        self.meshs.append(name) if kind == MESH else self.transforms.append(name)
+
+
+def split_method(method='scene'):
+    """
+    Split a method string into its scope and name. ex: 'set:modelSet' -> ('set', 'modelSet').
+    """
+    scope, _, name = str(method).partition(':')
+    return scope, name
+
+
+def classify(path=None):
+    """
+    Return MESH for a transform holding a single non intermediate mesh shape, TRANSFORM for a
+    transform holding none or several shapes, None otherwise. Mirrors MDagPath.extendToShape().
+    """
+    if path.apiType() != om2.MFn.kTransform: return None
+    shapes, shape_type = 0, None
+    for i in range(path.childCount()):
+        child = path.child(i)
+        if child.hasFn(om2.MFn.kShape) and not om2.MFnDagNode(child).isIntermediateObject:
+            shapes += 1
+            shape_type = child.apiType()
+    if shapes == 1:
+        return MESH if shape_type == om2.MFn.kMesh else None
+    return TRANSFORM
+
+
+def walk(scope=None, roots=None):
+    """
+    Classify every transform below the given roots, roots included, in one MItDag traversal each.
+    Without roots, the whole scene is traversed once.
+    """
+    iterator = om2.MItDag(om2.MItDag.kDepthFirst, om2.MFn.kTransform)
+    for root in ([None] if roots is None else roots):
+        if root is not None:
+            iterator.reset(root, om2.MItDag.kDepthFirst, om2.MFn.kTransform)
+        while not iterator.isDone():
+            scope.add(iterator.getPath())
+            iterator.next()
+    return scope
+
+
+def as_dag_paths(selection_list=None) -> list:
+    paths = []
+    for i in range(selection_list.length()):
+        try: paths.append(selection_list.getDagPath(i))
+        except: pass
+    return paths
+
+
+def resolve(method='scene', hierarchy=None) -> Scope:
+    """
+    Collect meshs and plain transforms for the given method:
+        'scene'               every transform of the scene.
+        'selection'           selected transforms only.
+        'topnode'             first selected transform and all its descendants, read from the
+                              hierarchy.Hierarchy index when one is given.
+        'set:<name>'          members of an object set.
+        'namespace:<name>'    every transform living in a namespace, nested ones included.
+        'layer:<name>'        display layer members and all their descendants.
+    """
+    scope, name = split_method(method)
+    result = Scope(method)
+    if scope == 'scene':
+        walk(result)
+    elif scope == 'selection':
+        [result.add(path) for path in as_dag_paths(om2.MGlobal.getActiveSelectionList())]
+    elif scope == 'topnode':
+        paths = as_dag_paths(om2.MGlobal.getActiveSelectionList())
+        if paths and hierarchy is not None:
+            members = hierarchy.subtree(paths[0].fullPathName())
+            if members: [result.add(path) for path in as_dag_paths(utils.list_as_MSelectionList(members))]
+        elif paths: walk(result, paths[:1])
+    elif scope == 'set' and name and cmds.objExists(name):
+        members = om2.MFnSet(om2.MGlobal.getSelectionListByName(name).getDependNode(0)).getMembers(True)
+        [result.add(path) for path in as_dag_paths(members)]
+    elif scope == 'namespace' and name:
+        namespace = name.strip(':')
+        iterator = om2.MItDag(om2.MItDag.kDepthFirst, om2.MFn.kTransform)
+        while not iterator.isDone():
+            node_namespace = om2.MFnDependencyNode(iterator.currentItem()).namespace.strip(':')
+            if node_namespace == namespace or node_namespace.startswith(f"{namespace}:"):
+                result.add(iterator.getPath())
+            iterator.next()
+    elif scope == 'layer' and name and cmds.objExists(name):
+        members = utils.noneAsList(cmds.editDisplayLayerMembers(name, query=True, fullNames=True))
+        if members: walk(result, as_dag_paths(utils.list_as_MSelectionList(members)))
+    return result
+
+
+def list_names(scope=None) -> list:
+    """
+    Return the names a named scope can be pointed at, to populate the interface choices.
+    """
+    if scope == 'set':
+        return [node for node in utils.noneAsList(cmds.ls(type='objectSet')) if cmds.nodeType(node) == 'objectSet']
+    if scope == 'namespace':
+        return [node for node in utils.noneAsList(cmds.namespaceInfo(listOnlyNamespaces=True, recurse=True)) if node not in ['UI','shared']]
+    if scope == 'layer':
+        return [node for node in utils.noneAsList(cmds.ls(type='displayLayer')) if node not in ['defaultLayer']]
+    return []
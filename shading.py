@@ -0,0 +1,53 @@
+"""
+CHECKER. (c)
+
+Author:  Gregoire Dehame
+Created: Oct 18, 2026
+Module:  checker.shading
+Purpose: shading assignment index, mapping meshs to shading engines and faces both ways.
+Execute: from checker import shading; shading.ShadingIndex([(node, mesh_data)])
+"""
+
+try:
+    import maya.api.OpenMaya as om2
+except: pass
+try:
+    import numpy as np
+except: pass
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+IGNORED_SHAPES = ['shaderBallGeomShape1']
+
+
+class ShadingIndex(object):
+    """
+    Shading assignment of several meshs, read with one getConnectedShaders and one
+    getConnectedSetsAndMembers call per mesh:
+        engines         {node: shading engine names}
+        assignments     {node: (F,) index into engines[node] of every face, -1 when unassigned}
+        object_members  {node: shading engines holding the whole mesh instead of its faces}
+        members         {shading engine: [(node, face ids)]}
+    """
+    def __init__(self, items=None):
+        self.engines, self.assignments, self.object_members, self.members = {}, {}, {}, {}
+        for node, data in items:
+            instance = data.dag_path.instanceNumber()
+            shaders, indices = data.fn.getConnectedShaders(instance)
+            self.engines[node] = [om2.MFnDependencyNode(shader).name() for shader in shaders]
+            self.assignments[node] = np.array(indices, dtype=np.int64)
+            for i, engine in enumerate(self.engines[node]):
+                self.members.setdefault(engine, []).append((node, np.flatnonzero(self.assignments[node] == i)))
+
+            sets, components = data.fn.getConnectedSetsAndMembers(instance, True)
+            self.object_members[node] = [om2.MFnDependencyNode(sets[i]).name() for i in range(len(sets))
+                                         if sets[i].hasFn(om2.MFn.kShadingEngine) and components[i].isNull()]
+
+    def faces(self, node=None, engine=None):
+        """
+        Return the face ids of node assigned to engine.
+        """
+        if engine not in self.engines.get(node, []): return np.zeros(0, dtype=np.int64)
+        return np.flatnonzero(self.assignments[node] == self.engines[node].index(engine))
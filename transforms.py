@@ -0,0 +1,73 @@
+"""
+CHECKER. (c)
+
+Author:  Gregoire Dehame
+Created: Oct 18, 2026
+Module:  checker.transforms
+Purpose: bulk transform reader, collecting matrices, pivots and channel states into arrays.
+Execute: from checker import transforms; transforms.TransformData(nodes, dag_paths)
+"""
+
+try:
+    import maya.api.OpenMaya as om2
+except: pass
+try:
+    import numpy as np
+except: pass
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+MATRIX_TOLERANCE = 0.000001
+PIVOT_TOLERANCE = 0.000001
+ATTRIBUTES = ['translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ', 'scaleX', 'scaleY', 'scaleZ', 'visibility']
+
+
+class TransformData(object):
+    """
+    Transform state of several nodes, read through MFnTransform in a single pass:
+        world_matrices  (N, 4, 4) world matrices.
+        rotate_pivots   (N, 3) object space rotate pivots.
+        scale_pivots    (N, 3) object space scale pivots.
+        locked          (N, A) lock state of every ATTRIBUTES channel.
+        keyable         (N, A) keyable state of every ATTRIBUTES channel.
+    """
+    def __init__(self, nodes=None, dag_paths=None):
+        self.nodes = list(nodes)
+        count = len(self.nodes)
+        self.world_matrices = np.zeros((count, 4, 4))
+        self.rotate_pivots = np.zeros((count, 3))
+        self.scale_pivots = np.zeros((count, 3))
+        self.locked = np.zeros((count, len(ATTRIBUTES)), dtype=bool)
+        self.keyable = np.zeros((count, len(ATTRIBUTES)), dtype=bool)
+        for i, path in enumerate(dag_paths):
+            fn = om2.MFnTransform(path)
+            self.world_matrices[i] = np.reshape(list(path.inclusiveMatrix()), (4, 4))
+            self.rotate_pivots[i] = list(fn.rotatePivot(om2.MSpace.kObject))[:3]
+            self.scale_pivots[i] = list(fn.scalePivot(om2.MSpace.kObject))[:3]
+            for j, attribute in enumerate(ATTRIBUTES):
+                plug = fn.findPlug(attribute, False)
+                self.locked[i, j] = plug.isLocked
+                self.keyable[i, j] = plug.isKeyable
+
+    def select(self, mask=None) -> list:
+        return [node for node, flagged in zip(self.nodes, mask) if flagged]
+
+    def columns(self, attributes=None):
+        return [ATTRIBUTES.index(attribute) for attribute in attributes]
+
+    def unfrozen(self, tolerance=MATRIX_TOLERANCE):
+        """
+        Return a (N,) mask of the nodes whose world matrix is not the identity, within tolerance.
+        """
+        return np.any(np.abs(self.world_matrices - np.identity(4)) > tolerance, axis=(1, 2))
+
+    def uncentered_pivots(self, tolerance=PIVOT_TOLERANCE):
+        return np.any(np.abs(self.rotate_pivots) > tolerance, axis=1) | np.any(np.abs(self.scale_pivots) > tolerance, axis=1)
+
+    def any_locked(self, attributes=ATTRIBUTES):
+        return np.any(self.locked[:, self.columns(attributes)], axis=1)
+
+    def any_not_keyable(self, attributes=ATTRIBUTES):
+        return np.any(~self.keyable[:, self.columns(attributes)], axis=1)
@@ -0,0 +1,51 @@
+"""
+CHECKER. (c)
+
+Author:  Gregoire Dehame
+Created: Oct 18, 2026
+Module:  checker.unused
+Purpose: mark and sweep search of orphaned shader, texture and utility networks.
+Execute: from checker import unused, graph; unused.unused_nodes(graph.Graph())
+"""
+
+try:
+    import maya.cmds as cmds
+except: pass
+try:
+    import numpy as np
+except: pass
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+from . import utils
+
+CLASSIFICATIONS = ['shader', 'texture', 'utility']
+REGISTRY_TYPES = ['defaultShaderList', 'defaultTextureList', 'defaultRenderUtilityList', 'materialInfo', 'nodeGraphEditorInfo', 'hyperLayout', 'hyperView', 'hyperGraphInfo']
+
+
+def is_network_type(node_type=None) -> bool:
+    """
+    Return True for shader, texture and utility node types, from their rendering classification.
+    """
+    for classification in utils.noneAsList(cmds.getClassification(node_type)):
+        for part in classification.split(':'):
+            if any(part.startswith(name) for name in CLASSIFICATIONS): return True
+    return False
+
+
+def unused_nodes(graph=None) -> list:
+    """
+    Mark every node feeding a consumer, then sweep the shading network nodes left unmarked.
+    Every node that is not a shading network node is a consumer: dag nodes, render setup, shading
+    engines, default nodes... Registry nodes listing every shader or texture are skipped so they
+    do not keep everything alive. Default and referenced nodes are never swept.
+    """
+    if not graph.nodes: return []
+    protected = set(utils.noneAsList(cmds.ls(defaultNodes=True, long=True))) | set(utils.noneAsList(cmds.ls(referencedNodes=True, long=True)))
+    network_types = {node_type: is_network_type(node_type) for node_type in set(graph.types)}
+    candidates = np.array([network_types[node_type] and node not in protected for node, node_type in zip(graph.nodes, graph.types)], dtype=bool)
+    registry = np.isin(np.array(graph.types), REGISTRY_TYPES)
+    used = graph.reachable(~candidates & ~registry)
+    return [graph.nodes[i] for i in np.flatnonzero(candidates & ~used)]
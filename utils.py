@@ -15,6 +15,7 @@ except: pass
     
 import sys
 import inspect
+import contextlib
 import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -115,37 +116,56 @@ def is_transform(object=None):
     except: return False
     
 def mesh_array(method='scene'):
-    array = []
-    if method == 'scene':
-        for transform in cmds.ls(typ="transform"):
-            if is_mesh(transform) and cmds.nodeType(transform) == 'transform': array.append(transform)
-    if method == 'selection':
-        for transform in cmds.ls(sl=1):
-            if is_mesh(transform) and cmds.nodeType(transform) == 'transform':  array.append(transform)
-    if method == 'topnode':
-        if cmds.ls(sl=1):
-            for transform in noneAsList(cmds.listRelatives(cmds.ls(sl=1)[0], allDescendents=True)):
-                if is_mesh(transform) and cmds.nodeType(transform) == 'transform':  array.append(transform)
-            if is_mesh(cmds.ls(sl=1)[0]) and cmds.nodeType(cmds.ls(sl=1)[0]) == 'transform':  array.append(cmds.ls(sl=1)[0])    
-    return array    
+    from . import scope
+    return scope.resolve(method).meshs
     
 def transform_array(method='scene'):
-    array = []
-    if method == 'scene':
-        for transform in cmds.ls(typ="transform"):
-            if is_transform(transform) and cmds.nodeType(transform) == 'transform': array.append(transform)
-    if method == 'selection':
-        for transform in cmds.ls(sl=1):
-            if is_transform(transform) and cmds.nodeType(transform) == 'transform':  array.append(transform)
-    if method == 'topnode':
-        if cmds.ls(sl=1):
-            for transform in noneAsList(cmds.listRelatives(cmds.ls(sl=1)[0], allDescendents=True)):
-                if is_transform(transform) and cmds.nodeType(transform) == 'transform':  array.append(transform)
-            if is_transform(cmds.ls(sl=1)[0]) and cmds.nodeType(cmds.ls(sl=1)[0]) == 'transform':  array.append(cmds.ls(sl=1)[0])    
-    return array           
+    from . import scope
+    return scope.resolve(method).transforms
     
 def list_as_MSelectionList(list=None):
     selection_list = om2.MSelectionList()
     [selection_list.add(object) for object in list]
     return selection_list
     
+    
+def delete_nodes(nodes=None) -> list:
+    """ unlock and delete nodes with one lockNode and one delete call, falling back to one node at a time if the batch fails.
+            Args:
+                nodes (list): - nodes to remove. ex: ['unknown1', 'expression1']
+            Returns:
+                list: nodes that could not be removed.
+    """
+    nodes = noneAsList(cmds.ls(nodes))
+    if not nodes: return []
+    try: cmds.lockNode(nodes, lock=False)
+    except: pass
+    try: 
+        cmds.delete(nodes)
+        return []
+    except: pass
+    failed = []
+    for node in nodes:
+        if not cmds.objExists(node): continue
+        try:
+            cmds.lockNode(node, lock=False)
+            cmds.delete(node)
+        except: 
+            logger.info('- unable to remove "%s".'%node)
+            failed.append(node)
+    return failed
+    
+@contextlib.contextmanager
+def undo_chunk(name='checker', undo=True):
+    """ group every maya operation of the block into a single undo chunk, or run it with the undo queue disabled.
+            Args:
+                name (str): - undo chunk name.
+                undo (bool): - False to run without recording undo, for headless runs.
+    """
+    state = cmds.undoInfo(query=True, state=True)
+    if undo: cmds.undoInfo(openChunk=True, chunkName=name)
+    else:    cmds.undoInfo(stateWithoutFlush=False)
+    try: yield
+    finally:
+        if undo: cmds.undoInfo(closeChunk=True)
+        else:    cmds.undoInfo(stateWithoutFlush=state)